@@ -0,0 +1,75 @@
+import random
+import timeit
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.turtle import Turtle, COLORS
+from rushing_turtles.model.card import Card
+
+MOVES = 20000
+OFFSETS = [1, 1, 1, 1, 2, -1]
+
+
+class ScanningBoard(Board):
+    # queries as they were implemented before the position index
+
+    def is_last(self, turtle):
+        if self._is_in_start_field(turtle):
+            return True
+        if self.start_field:
+            return False
+        for stack in self.further_fields:
+            if stack:
+                return turtle in stack
+
+    def _find_height(self, turtle):
+        stack = self._find_stack(turtle)
+        return len(stack) - 1 - stack.index(turtle)
+
+    def _find_pos(self, turtle):
+        if self._is_in_start_field(turtle):
+            return 0
+        for idx, stack in enumerate(self.further_fields):
+            if turtle in stack:
+                return idx + 1
+        raise ValueError(f'Turtle {turtle} does not exist in further fields')
+
+    def _is_in_start_field(self, turtle):
+        return any([turtle in stack for stack in self.start_field])
+
+    def is_move_with_card_possible(self, card):
+        if card.is_rainbow():
+            return card.offset > 0 or \
+                max([self._find_pos(turtle) for turtle in self.turtles]) > 0
+        turtle = Turtle(card.color)
+        return turtle in self.turtles and \
+            (card.offset > 0 or self._find_pos(turtle) > 0)
+
+
+def play_long_random_game(board_cls, seed=0):
+    rng = random.Random(seed)
+    turtles = [Turtle(color) for color in COLORS]
+    cards = [Card(0, 'RAINBOW', 'MINUS')] + \
+        [Card(0, color, 'PLUS') for color in COLORS]
+    board = board_cls(turtles)
+
+    for _ in range(MOVES):
+        turtle = rng.choice(turtles)
+        offset = rng.choice(OFFSETS)
+        board.is_last(turtle)
+        for card in cards:
+            board.is_move_with_card_possible(card)
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+        if board.has_anyone_finished():
+            board.get_ranking()
+            board = board_cls(turtles)
+
+
+if __name__ == '__main__':
+    print(f'{MOVES} random moves with queries')
+    for name, board_cls in [('scanning', ScanningBoard), ('indexed', Board)]:
+        elapsed = timeit.timeit(lambda: play_long_random_game(board_cls),
+                                number=3) / 3
+        print(f'{name:>10}: {elapsed * 1000:8.1f} ms, '
+              f'{elapsed / MOVES * 1e6:6.2f} us per move')
@@ -0,0 +1,52 @@
+import random
+import timeit
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.game import CARDS
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+FIELDS = [10, 100, 1000]
+TURTLES = [2, len(COLORS)]
+MOVES = 20000
+OFFSETS = [1, 1, 1, 1, 2, -1]
+
+
+def create_moves(turtles, seed=0):
+    rng = random.Random(seed)
+    return [(rng.choice(turtles), rng.choice(OFFSETS)) for _ in range(MOVES)]
+
+
+def play_moves(board_args, moves):
+    board = Board(*board_args)
+    for turtle, offset in moves:
+        if offset < 0 and board._find_pos(turtle) == 0:
+            offset = 1
+        board.move(turtle, offset)
+        if board.has_anyone_finished():
+            board = Board(*board_args)
+    return board
+
+
+def run_queries(board, turtles):
+    for turtle in turtles:
+        board.is_last(turtle)
+    for card in CARDS[:5]:
+        board.is_move_with_card_possible(card)
+    board.get_ranking()
+    board.has_anyone_finished()
+
+
+if __name__ == '__main__':
+    print(f'{"fields":>6} {"turtles":>7} {"move":>10} {"queries":>10}')
+    for number_of_fields in FIELDS:
+        for number_of_turtles in TURTLES:
+            turtles = [Turtle(color) for color in COLORS[:number_of_turtles]]
+            moves = create_moves(turtles)
+            board_args = (turtles, number_of_fields)
+            move_time = timeit.timeit(
+                lambda: play_moves(board_args, moves), number=1) / MOVES
+            board = play_moves(board_args, moves[:number_of_fields // 2])
+            query_time = timeit.timeit(
+                lambda: run_queries(board, turtles), number=MOVES) / MOVES
+            print(f'{number_of_fields:>6} {number_of_turtles:>7} '
+                  f'{move_time * 1e6:7.2f} us {query_time * 1e6:7.2f} us')
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from rushing_turtles.server import GameServer
+from rushing_turtles.game_controller import GameController
+from rushing_turtles.messages import MessageDeserializer, MsgToSend
+
+PLAYERS = 5
+SLOW_PEER_DELAY = 0.5
+ROUNDS = 5
+
+
+class DelayedWebsocket(object):
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.received_at = None
+
+    async def send(self, content):
+        await asyncio.sleep(self.delay)
+        self.received_at = time.perf_counter()
+
+
+async def broadcast_latency(server):
+    # the slow peer is the first recipient, so a sequential send
+    # delays everybody else
+    websockets = [DelayedWebsocket(SLOW_PEER_DELAY)] + \
+        [DelayedWebsocket(0) for _ in range(PLAYERS - 1)]
+    msgs = [MsgToSend(ws, message='game state updated') for ws in websockets]
+
+    start = time.perf_counter()
+    await server._send_messages(msgs)
+
+    fast_latencies = [ws.received_at - start for ws in websockets[1:]]
+    return max(fast_latencies), time.perf_counter() - start
+
+
+def run(concurrent_send):
+    server = GameServer(GameController(), MessageDeserializer(),
+                        concurrent_send=concurrent_send)
+    results = [asyncio.run(broadcast_latency(server)) for _ in range(ROUNDS)]
+    fast_peers = sum(result[0] for result in results) / ROUNDS
+    whole_batch = sum(result[1] for result in results) / ROUNDS
+    mode = 'concurrent' if concurrent_send else 'sequential'
+    print(f'{mode:>10}: fast peers served after {fast_peers * 1000:8.2f} ms, '
+          f'whole batch {whole_batch * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    print(f'{PLAYERS} recipients, one delayed by {SLOW_PEER_DELAY}s')
+    run(concurrent_send=False)
+    run(concurrent_send=True)
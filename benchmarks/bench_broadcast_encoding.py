@@ -0,0 +1,41 @@
+import timeit
+
+from rushing_turtles.messages import MsgToSend
+
+RECIPIENTS = [5, 100, 10000]
+REPEATS = 20
+
+PAYLOAD = {
+    'message': 'game state updated',
+    'board': {
+        'turtles_in_game_positions': [['RED', 'BLUE'], [], ['GREEN'], [], [],
+                                      ['YELLOW'], [], [], []],
+        'turtles_on_start_positions': [['PURPLE']]
+    },
+    'active_player_idx': 1,
+    'recently_played_card': {'card_id': 28, 'color': 'YELLOW',
+                             'action': 'PLUS'}
+}
+
+
+def encode_per_recipient(websockets):
+    return [MsgToSend(ws, **PAYLOAD) for ws in websockets]
+
+
+def encode_once(websockets):
+    return MsgToSend.broadcast(websockets, **PAYLOAD)
+
+
+def run(recipients):
+    websockets = list(range(recipients))
+    print(f'{recipients} recipients')
+    for name, encode in [('encoded per recipient', encode_per_recipient),
+                         ('encoded once', encode_once)]:
+        elapsed = timeit.timeit(lambda: encode(websockets), number=REPEATS)
+        per_second = recipients * REPEATS / elapsed
+        print(f'{name:>24}: {per_second:14,.0f} messages/s')
+
+
+if __name__ == '__main__':
+    for recipients in RECIPIENTS:
+        run(recipients)
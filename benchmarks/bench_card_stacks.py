@@ -0,0 +1,77 @@
+import random
+import timeit
+import tracemalloc
+
+from collections import deque
+
+from rushing_turtles.model.card_stacks import CardStacks
+from rushing_turtles.model.game import create_cards, HAND_SIZE
+
+TURNS = 50000
+
+
+class DequeCardStacks(object):
+    # implementation from before the array-backed piles
+
+    def __init__(self, available_cards, rng=random):
+        self.available_cards = deque(available_cards)
+        self.played_cards = deque()
+        self.rng = rng
+
+    def put(self, card):
+        self.played_cards.appendleft(card)
+
+    def get_new(self):
+        return self.get_new_cards(1)[0]
+
+    def get_new_cards(self, cnt):
+        if len(self.available_cards) < cnt:
+            self._reshuffle()
+        return [self.available_cards.popleft() for _ in range(cnt)]
+
+    def _reshuffle(self):
+        if self.played_cards:
+            recently_played_card = self.played_cards.popleft()
+            cards_list = list(self.played_cards)
+            self.rng.shuffle(cards_list)
+            self.available_cards = deque(cards_list)
+            self.played_cards = deque([recently_played_card])
+
+
+def play_draw_heavy_turns(stacks_cls):
+    # every turn a card is played and replaced; every 10th turn the hand
+    # is redrawn like in Game._ensure_player_can_move
+    stacks = stacks_cls(create_cards(), random.Random(0))
+    hand = stacks.get_new_cards(HAND_SIZE)
+    for turn in range(TURNS):
+        if turn % 10 == 0:
+            for card in hand:
+                stacks.put(card)
+            hand = stacks.get_new_cards(HAND_SIZE)
+        else:
+            stacks.put(hand.pop())
+            hand.append(stacks.get_new())
+
+
+def measure_reshuffle_peak(stacks_cls):
+    # peak of memory allocated while a full discard pile is reshuffled
+    stacks = stacks_cls(create_cards(), random.Random(0))
+    for card in stacks.get_new_cards(len(create_cards())):
+        stacks.put(card)
+
+    tracemalloc.start()
+    stacks.get_new()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == '__main__':
+    print(f'{TURNS} draw-heavy turns')
+    for name, stacks_cls in [('deque', DequeCardStacks),
+                             ('array', CardStacks)]:
+        elapsed = min(timeit.repeat(lambda: play_draw_heavy_turns(stacks_cls),
+                                    number=1, repeat=7))
+        print(f'{name:>6}: {elapsed * 1000:8.1f} ms, '
+              f'{elapsed / TURNS * 1e6:6.2f} us per turn, '
+              f'{measure_reshuffle_peak(stacks_cls):5d} B peak per reshuffle')
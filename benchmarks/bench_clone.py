@@ -0,0 +1,35 @@
+import copy
+import random
+import timeit
+
+from rushing_turtles.model.game import create_game
+from rushing_turtles.model.person import Person
+
+CLONES = 20000
+
+
+def play_moves(game, moves, rng):
+    for _ in range(moves):
+        person = game.active_player.person
+        if game.play(person, rng.choice(game.get_legal_actions(person))):
+            return
+
+
+def clone_and_play(game, rng):
+    clone = game.clone()
+    play_moves(clone, 1, rng)
+
+
+if __name__ == '__main__':
+    people = [Person(idx, f'Player {idx}') for idx in range(3)]
+    rng = random.Random(0)
+    for moves in [0, 20, 60]:
+        game = create_game(people, seed=0)
+        play_moves(game, moves, rng)
+        print(f'after {len(game.history)} moves, '
+              f'{game.stacks.reshuffles} reshuffles')
+        for name, run in [('deepcopy', lambda: copy.deepcopy(game)),
+                          ('clone', game.clone),
+                          ('clone + move', lambda: clone_and_play(game, rng))]:
+            elapsed = timeit.timeit(run, number=CLONES)
+            print(f'{name:>14}: {elapsed / CLONES * 1e6:7.2f} us per clone')
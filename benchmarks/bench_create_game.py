@@ -0,0 +1,43 @@
+import random
+import timeit
+
+from rushing_turtles.model.game import Game, create_game, create_cards
+from rushing_turtles.model.person import Person
+from rushing_turtles.model.turtle import Turtle
+
+GAMES = 5000
+LOOKUPS = 100000
+
+
+def create_game_with_fresh_cards(people):
+    # how games were created before the shared card catalog
+    turtles = [Turtle('RED'), Turtle('GREEN'), Turtle('BLUE'),
+               Turtle('PURPLE'), Turtle('YELLOW')]
+    cards = create_cards()
+    random.shuffle(cards)
+    return Game(people, turtles, cards)
+
+
+def find_card_by_scan(cards, id):
+    for card in cards:
+        if card.id == id:
+            return card
+
+
+if __name__ == '__main__':
+    people = [Person(idx, f'Player {idx}') for idx in range(3)]
+    print(f'creating {GAMES} games')
+    for name, create in [('fresh cards', create_game_with_fresh_cards),
+                         ('catalog', create_game)]:
+        elapsed = timeit.timeit(lambda: create(people), number=GAMES)
+        print(f'{name:>12}: {elapsed / GAMES * 1e6:7.2f} us per game')
+
+    game = create_game(people)
+    deck = create_cards()
+    ids = [random.randrange(len(deck)) for _ in range(LOOKUPS)]
+    print(f'{LOOKUPS} card lookups')
+    for name, get_card in [('scan', lambda id: find_card_by_scan(deck, id)),
+                           ('catalog', game.get_card)]:
+        elapsed = timeit.timeit(lambda: [get_card(id) for id in ids],
+                                number=1)
+        print(f'{name:>12}: {elapsed / LOOKUPS * 1e9:7.1f} ns per lookup')
@@ -0,0 +1,76 @@
+import timeit
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.card import Card
+from rushing_turtles.model.game import CARDS
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+NUMBER = 200000
+
+
+class StringTurtle(object):
+    # turtle as it was before integer color ids
+
+    def __init__(self, color):
+        if color not in COLORS:
+            raise ValueError(f'Invalid color: {color}')
+        self.color = color
+
+    def __eq__(self, other):
+        return self.color == other.color
+
+    def __hash__(self):
+        return hash(self.color)
+
+
+class StringBoard(Board):
+    # card checks as they were implemented on color and symbol strings
+
+    def is_move_with_card_possible(self, card):
+        if card.color == 'RAINBOW':
+            return card.offset > 0 or \
+                any(pos > 0 for pos, _ in self.positions.values())
+        return self._is_move_with_regular_card_possible(card)
+
+    def _is_move_with_regular_card_possible(self, card):
+        turtle = Turtle(card.color)
+        if turtle not in self.turtles:
+            return False
+        if card.offset < 0 and self._find_pos(turtle) == 0:
+            return False
+        return True
+
+
+def compare(title, legacy, current):
+    legacy_time = timeit.timeit(legacy, number=NUMBER) / NUMBER
+    current_time = timeit.timeit(current, number=NUMBER) / NUMBER
+    print(f'{title:>32}: {legacy_time * 1e9:7.1f} ns -> '
+          f'{current_time * 1e9:7.1f} ns')
+
+
+if __name__ == '__main__':
+    string_positions = {StringTurtle(color): 0 for color in COLORS}
+    string_turtle = StringTurtle('PURPLE')
+    positions = {Turtle(color): 0 for color in COLORS}
+    turtle = Turtle('PURPLE')
+    compare('turtle lookup in positions',
+            lambda: string_positions[string_turtle],
+            lambda: positions[turtle])
+
+    card = Card(0, 'RAINBOW', 'ARROW_ARROW')
+    symbol, color = card.symbol, card.color
+    compare('arrow check',
+            lambda: symbol in ['ARROW', 'ARROW_ARROW'],
+            card.is_arrow)
+    compare('rainbow check', lambda: color == 'RAINBOW', card.is_rainbow)
+
+    turtles = [Turtle(color) for color in COLORS]
+    hand = CARDS[:5]
+    string_board, board = StringBoard(turtles), Board(turtles)
+    for current in [string_board, board]:
+        current.move(turtles[0], 1)
+    compare('is_move_with_card_possible x5',
+            lambda: [string_board.is_move_with_card_possible(card)
+                     for card in hand],
+            lambda: [board.is_move_with_card_possible(card)
+                     for card in hand])
@@ -0,0 +1,56 @@
+import timeit
+
+from rushing_turtles.room import Room, MAX_PLAYERS_IN_ROOM
+from rushing_turtles.messages import HelloServerMsg, WantToJoinMsg
+
+LOBBY_SIZES = [1000, 10000, 50000]
+STORMS = 20
+
+
+def create_lobby(size):
+    room = Room('bench')
+    for pid in range(size):
+        room.handle(HelloServerMsg(pid, f'Player_{pid}'), pid)
+    return room
+
+
+def join_storm(room):
+    # players keep joining the room and dropping out before the game starts
+    for pid in range(MAX_PLAYERS_IN_ROOM):
+        room.handle(WantToJoinMsg(pid), pid)
+    for pid in range(MAX_PLAYERS_IN_ROOM):
+        room.disconnected(pid)
+        room.handle(HelloServerMsg(pid, f'Player_{pid}'), pid)
+
+
+def outside_room_with_list(people, players):
+    return [person for person in people if person not in players]
+
+
+def outside_room_with_dict(people, players):
+    return [person for person in people if person.id not in players]
+
+
+def run(size):
+    room = create_lobby(size)
+    print(f'{size} people in the lobby')
+
+    elapsed = timeit.timeit(lambda: join_storm(room), number=STORMS)
+    joins = STORMS * MAX_PLAYERS_IN_ROOM
+    print(f'{"join storm":>28}: {elapsed / joins * 1000:8.3f} ms per join')
+
+    people = list(room.people.values())
+    for pid in range(MAX_PLAYERS_IN_ROOM):
+        room.handle(WantToJoinMsg(pid), pid)
+    players_list = list(room.players.values())
+
+    for name, scan, players in [
+            ('outside room (list)', outside_room_with_list, players_list),
+            ('outside room (dict)', outside_room_with_dict, room.players)]:
+        elapsed = timeit.timeit(lambda: scan(people, players), number=STORMS)
+        print(f'{name:>28}: {elapsed / STORMS * 1000:8.3f} ms per broadcast')
+
+
+if __name__ == '__main__':
+    for size in LOBBY_SIZES:
+        run(size)
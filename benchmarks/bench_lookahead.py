@@ -0,0 +1,56 @@
+import copy
+import itertools
+import timeit
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+DEPTH = 3
+OFFSETS = [1, 2, -1]
+
+
+def create_midgame_board():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    for turtle, offset in zip(turtles, [1, 1, 2, 3, 1]):
+        board.move(turtle, offset)
+    return board
+
+
+def legal_moves(board):
+    for turtle, offset in itertools.product(board.turtles, OFFSETS):
+        if offset > 0 or board._find_pos(turtle) > 0:
+            yield turtle, offset
+
+
+def search_with_copies(board, depth):
+    if depth == 0:
+        return 1
+    nodes = 1
+    for turtle, offset in list(legal_moves(board)):
+        child = copy.deepcopy(board)
+        child.move(turtle, offset)
+        nodes += search_with_copies(child, depth - 1)
+    return nodes
+
+
+def search_with_undo(board, depth):
+    if depth == 0:
+        return 1
+    nodes = 1
+    for turtle, offset in list(legal_moves(board)):
+        undo = board.apply_move(turtle, offset)
+        nodes += search_with_undo(board, depth - 1)
+        board.undo_move(undo)
+    return nodes
+
+
+if __name__ == '__main__':
+    board = create_midgame_board()
+    nodes = search_with_undo(board, DEPTH)
+    print(f'lookahead of depth {DEPTH} ({nodes} nodes)')
+    for name, search in [('deepcopy', search_with_copies),
+                         ('make/unmake', search_with_undo)]:
+        elapsed = timeit.timeit(lambda: search(board, DEPTH), number=3) / 3
+        print(f'{name:>12}: {elapsed * 1000:8.1f} ms, '
+              f'{elapsed / nodes * 1e6:6.2f} us per node')
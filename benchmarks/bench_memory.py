@@ -0,0 +1,49 @@
+import gc
+import random
+import tracemalloc
+
+from rushing_turtles.game_controller import GameController
+from rushing_turtles.messages import HelloServerMsg
+from rushing_turtles.model.game import create_game
+from rushing_turtles.model.person import Person
+
+SIZES = [1000, 10000]
+PLAYERS_PER_GAME = 3
+PEOPLE_PER_ROOM = 5
+
+
+def measure(create, size):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = create(size)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / size
+
+
+def create_games(size):
+    random.seed(0)
+    return [create_game([Person(size * game_idx + idx, f'Player {idx}')
+                         for idx in range(PLAYERS_PER_GAME)])
+            for game_idx in range(size)]
+
+
+def connect_people(size):
+    controller = GameController()
+    for idx in range(size):
+        room_id = f'room {idx // PEOPLE_PER_ROOM}'
+        controller.handle(HelloServerMsg(idx, f'Player {idx}', room_id),
+                          websocket=f'ws {idx}')
+    return controller
+
+
+if __name__ == '__main__':
+    for size in SIZES:
+        print(f'{size:>6} live games: '
+              f'{measure(create_games, size):8.0f} B per game')
+    for size in SIZES:
+        print(f'{size:>6} connected people: '
+              f'{measure(connect_people, size):8.0f} B per person')
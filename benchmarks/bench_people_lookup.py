@@ -0,0 +1,57 @@
+import timeit
+
+from rushing_turtles.room import Room
+from rushing_turtles.messages import HelloServerMsg
+
+LOBBY_SIZES = [10000, 100000]
+LOOKUPS = 1000
+
+
+def create_lobby(size):
+    room = Room('bench')
+    for pid in range(size):
+        room.handle(HelloServerMsg(pid, f'Player_{pid}'), f'ws{pid}')
+    return room
+
+
+def scan_by_id(people, id):
+    for person in people:
+        if person.id == id:
+            return person
+
+
+def scan_by_websocket(people, websocket):
+    for person in people:
+        if person.websocket == websocket:
+            return person
+
+
+def scan_is_connected(people, id):
+    return id in [person.id for person in people if person.is_connected()]
+
+
+def measure(name, lookup, size):
+    pids = [(size * i) // LOOKUPS for i in range(LOOKUPS)]
+    elapsed = timeit.timeit(lambda: [lookup(pid) for pid in pids], number=1)
+    print(f'{name:>32}: {elapsed / LOOKUPS * 1e6:10.2f} us per lookup')
+
+
+def run(size):
+    room = create_lobby(size)
+    people = list(room.people.values())
+    print(f'{size} connected people')
+
+    measure('scan by id', lambda pid: scan_by_id(people, pid), size)
+    measure('index by id', room._find_person, size)
+    measure('scan by websocket',
+            lambda pid: scan_by_websocket(people, f'ws{pid}'), size)
+    measure('index by websocket',
+            lambda pid: room._find_person_by_websocket(f'ws{pid}'), size)
+    measure('scan is connected',
+            lambda pid: scan_is_connected(people, pid), size)
+    measure('index is connected', room._is_person_already_connected, size)
+
+
+if __name__ == '__main__':
+    for size in LOBBY_SIZES:
+        run(size)
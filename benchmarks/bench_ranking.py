@@ -0,0 +1,46 @@
+import random
+import timeit
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+MOVES = 20000
+OFFSETS = [1, 1, 1, 1, 2, -1]
+
+
+class SortingBoard(Board):
+    # ranking as it was computed before it was maintained incrementally
+
+    def get_ranking(self):
+        return sorted(
+            self.turtles,
+            key=lambda x: (self._find_pos(x), self._find_height(x), x.color),
+            reverse=True
+        )
+
+
+def play_with_standings(board_cls, seed=0):
+    # the standings are read after every move, like a live standings strip
+    rng = random.Random(seed)
+    turtles = [Turtle(color) for color in COLORS]
+    board = board_cls(turtles)
+
+    for _ in range(MOVES):
+        turtle = rng.choice(turtles)
+        offset = rng.choice(OFFSETS)
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+        board.get_ranking()
+        if board.has_anyone_finished():
+            board = board_cls(turtles)
+
+
+if __name__ == '__main__':
+    print(f'{MOVES} random moves, ranking read after each of them')
+    for name, board_cls in [('sorting', SortingBoard),
+                            ('incremental', Board)]:
+        elapsed = timeit.timeit(lambda: play_with_standings(board_cls),
+                                number=3) / 3
+        print(f'{name:>12}: {elapsed * 1000:8.1f} ms, '
+              f'{elapsed / MOVES * 1e6:6.2f} us per move')
@@ -0,0 +1,36 @@
+import random
+import time
+
+import numpy as np
+
+from rushing_turtles.simulation import play_game, RandomPolicy
+from rushing_turtles.vectorized import simulate_random_games
+
+PLAYERS = 3
+SIZES = [1, 1000, 100000]
+OBJECT_GAMES = 1000
+
+
+def measure_object_engine():
+    random.seed(0)
+    rng = random.Random(0)
+    policies = [RandomPolicy() for _ in range(PLAYERS)]
+    start = time.perf_counter()
+    for _ in range(OBJECT_GAMES):
+        play_game(policies, rng)
+    return OBJECT_GAMES / (time.perf_counter() - start)
+
+
+def measure_vectorized_engine(size):
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    simulate_random_games(size, PLAYERS, rng)
+    return size / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print(f'random games of {PLAYERS} players, games per second')
+    print(f'{"Game objects":>16}: {measure_object_engine():12.0f}')
+    for size in SIZES:
+        print(f'{f"lockstep N={size}":>16}: '
+              f'{measure_vectorized_engine(size):12.0f}')
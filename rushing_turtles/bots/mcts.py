@@ -0,0 +1,227 @@
+import math
+import random
+import time
+
+from collections import namedtuple
+from typing import List, Tuple
+
+from rushing_turtles.model.action import Action
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.card import Card
+from rushing_turtles.model.compact_board import CompactBoard
+from rushing_turtles.model.game import Game, HAND_SIZE, list_legal_actions
+from rushing_turtles.model.person import Person
+from rushing_turtles.model.player import Player
+
+TIME_BUDGET = 1.0
+EXPLORATION = 1.4
+ROLLOUT_DEPTH = 40
+
+# What the searching player knows about the game. It is small and picklable,
+# so the search can run in a worker process.
+SearchState = namedtuple('SearchState',
+                         'board, seat_colors, seat, hand, unknown_cards, ' +
+                         'hand_sizes, played_cards')
+
+MoveKey = Tuple[int, str]
+
+
+def get_search_state(game: Game, person: Person) -> SearchState:
+    hand = list(game.get_persons_cards(person))
+    played_cards = game.stacks.played_cards
+    known_ids = {card.id for card in hand + played_cards}
+    return SearchState(
+        CompactBoard.from_board(game.board),
+        [player.turtle.color_id for player in game.players],
+        game.get_person_idx(person),
+        hand,
+        [card for card in game.cards if card.id not in known_ids],
+        [len(player.cards) for player in game.players],
+        played_cards
+    )
+
+
+def search(state: SearchState, time_budget: float = TIME_BUDGET,
+           seed: int = None, exploration: float = EXPLORATION,
+           max_iterations: int = None) -> MoveKey:
+    board = state.board.to_board()
+    actions = list_legal_actions(board, board.turtles, state.hand)
+    if not actions:
+        raise ValueError('There is no legal move in the given state')
+    if len(actions) == 1:
+        return _get_key(actions[0])
+
+    rng = random.Random(seed)
+    root = _Node(state.seat)
+    deadline = time.monotonic() + time_budget
+    iterations = 0
+    while iterations == 0 or time.monotonic() < deadline:
+        if max_iterations is not None and iterations >= max_iterations:
+            break
+        _iterate(root, _Playout(state, board, rng), rng, exploration)
+        iterations += 1
+
+    return max(root.children, key=lambda key: root.children[key].visits)
+
+
+def _get_key(action: Action) -> MoveKey:
+    return action.card.id, action.color
+
+
+class _Node(object):
+    __slots__ = ('seat', 'visits', 'reward', 'available', 'children')
+
+    def __init__(self, seat: int):
+        # seat is the player who made the move leading to this node
+        self.seat = seat
+        self.visits = 0
+        self.reward = 0.0
+        self.available = 0
+        self.children = {}
+
+    def get_ucb(self, exploration: float) -> float:
+        return self.reward / self.visits + exploration * \
+            math.sqrt(math.log(self.available) / self.visits)
+
+
+class _OutOfCards(Exception):
+    pass
+
+
+class _Playout(object):
+    # A single determinization of the hidden cards, played on the shared
+    # board with apply_move and rolled back with undo_move afterwards.
+
+    def __init__(self, state: SearchState, board: Board, rng: random.Random):
+        unknown_cards = list(state.unknown_cards)
+        rng.shuffle(unknown_cards)
+
+        self.hands = []
+        for seat, size in enumerate(state.hand_sizes):
+            if seat == state.seat:
+                self.hands.append(list(state.hand))
+            else:
+                self.hands.append(unknown_cards[:size])
+                del unknown_cards[:size]
+
+        self.board = board
+        self.turtles = {turtle.color_id: turtle for turtle in board.turtles}
+        self.seat_turtles = [self.turtles[color_id]
+                             for color_id in state.seat_colors]
+        self.draw_pile = unknown_cards
+        self.discard_pile = list(reversed(state.played_cards))
+        self.seat = state.seat
+        self.finished = False
+        self.undos = []
+        self.rng = rng
+
+    def get_actions(self) -> List[Action]:
+        return list_legal_actions(self.board, self.board.turtles,
+                                  self.hands[self.seat])
+
+    def play(self, action: Action) -> None:
+        turtle = self.turtles[action.color_id]
+        self.undos.append(self.board.apply_move(turtle, action.get_offset()))
+
+        hand = self.hands[self.seat]
+        hand.remove(action.card)
+        self.discard_pile.append(action.card)
+        hand.append(self._draw())
+
+        if self.board.has_anyone_finished():
+            self.finished = True
+            return
+
+        self.seat = (self.seat + 1) % len(self.hands)
+        while not self.board.is_move_with_any_card_possible(
+                self.hands[self.seat]):
+            self.hands[self.seat] = [self._draw() for _ in range(HAND_SIZE)]
+
+    def _draw(self) -> Card:
+        if not self.draw_pile:
+            self.draw_pile = self.discard_pile[:-1]
+            self.discard_pile = self.discard_pile[-1:]
+            self.rng.shuffle(self.draw_pile)
+        if not self.draw_pile:
+            raise _OutOfCards()
+        return self.draw_pile.pop()
+
+    def get_rewards(self) -> List[float]:
+        # players are rewarded linearly from 1 for the first place
+        # to 0 for the last one
+        places = {}
+        for turtle in self.board.get_ranking():
+            if turtle in self.seat_turtles:
+                places[turtle] = len(places)
+
+        worst = max(len(self.seat_turtles) - 1, 1)
+        return [1 - places[turtle] / worst for turtle in self.seat_turtles]
+
+    def undo(self) -> None:
+        for undo in reversed(self.undos):
+            self.board.undo_move(undo)
+
+
+def _iterate(root: _Node, playout: _Playout, rng: random.Random,
+             exploration: float) -> None:
+    path = []
+    try:
+        node = root
+        while not playout.finished:
+            actions = playout.get_actions()
+            untried = []
+            for action in actions:
+                child = node.children.get(_get_key(action))
+                if child is None:
+                    untried.append(action)
+                else:
+                    child.available += 1
+
+            if untried:
+                action = rng.choice(untried)
+                child = _Node(playout.seat)
+                child.available = 1
+                node.children[_get_key(action)] = child
+                path.append(child)
+                playout.play(action)
+                break
+
+            action = max(actions, key=lambda action: node.children[
+                _get_key(action)].get_ucb(exploration))
+            node = node.children[_get_key(action)]
+            path.append(node)
+            playout.play(action)
+
+        for _ in range(ROLLOUT_DEPTH):
+            if playout.finished:
+                break
+            playout.play(rng.choice(playout.get_actions()))
+    except _OutOfCards:
+        pass
+    finally:
+        rewards = playout.get_rewards()
+        playout.undo()
+
+    for node in path:
+        node.visits += 1
+        node.reward += rewards[node.seat]
+
+
+class MCTSBot(object):
+    time_budget: float
+    max_iterations: int
+    exploration: float
+
+    def __init__(self, time_budget: float = TIME_BUDGET,
+                 max_iterations: int = None,
+                 exploration: float = EXPLORATION):
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.exploration = exploration
+
+    def choose_action(self, game: Game, player: Player,
+                      rng: random.Random) -> Action:
+        card_id, color = search(get_search_state(game, player.person),
+                                self.time_budget, rng.getrandbits(64),
+                                self.exploration, self.max_iterations)
+        return Action(game.get_card(card_id), color)
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import Any, Iterable, Tuple
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.card import Card
+
+LRU = 'lru'
+DEPTH_PREFERRED = 'depth-preferred'
+EVICTION_POLICIES = [LRU, DEPTH_PREFERRED]
+
+TableKey = Tuple[int, int, Tuple[int, ...]]
+
+
+def make_key(board: Board, active_player_idx: int,
+             cards: Iterable[Card]) -> TableKey:
+    return (board.hash, active_player_idx,
+            tuple(sorted(card.id for card in cards)))
+
+
+class TranspositionTable(object):
+    max_size: int
+    policy: str
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, max_size: int, policy: str = LRU):
+        if max_size < 1:
+            raise ValueError(
+                f'Transposition table size must be positive: {max_size}')
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f'Unknown eviction policy: {policy}')
+
+        self.max_size = max_size
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if policy == LRU:
+            self._entries = OrderedDict()
+        else:
+            self._slots = [None] * max_size
+
+    def get(self, key: TableKey, min_depth: int = 0) -> Any:
+        entry = self._find(key)
+        if entry is None or entry[1] < min_depth:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[0]
+
+    def _find(self, key: TableKey):
+        if self.policy == LRU:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        slot = self._slots[hash(key) % self.max_size]
+        if slot is None or slot[0] != key:
+            return None
+        return slot[1:]
+
+    def put(self, key: TableKey, value: Any, depth: int = 0) -> None:
+        if self.policy == LRU:
+            self._entries[key] = (value, depth)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return
+
+        idx = hash(key) % self.max_size
+        slot = self._slots[idx]
+        if slot is not None and slot[0] != key:
+            if slot[2] > depth:
+                return
+            self.evictions += 1
+        self._slots[idx] = (key, value, depth)
+
+    def __len__(self):
+        if self.policy == LRU:
+            return len(self._entries)
+        return sum(slot is not None for slot in self._slots)
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions
+        }
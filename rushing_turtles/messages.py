@@ -1,11 +1,16 @@
 from collections import namedtuple
+from typing import List
 
 import json
 
-HelloServerMsg = namedtuple('HelloServerMsg', 'player_id, player_name')
+HelloServerMsg = namedtuple('HelloServerMsg',
+                            'player_id, player_name, room_id',
+                            defaults=(None,))
 WantToJoinMsg = namedtuple('WantToJoinTheGame', 'player_id')
-StartGameMsg = namedtuple('StartGame', 'player_id')
-ReadyToReceiveGameState = namedtuple('ReadyToReceiveGameState', 'player_id')
+StartGameMsg = namedtuple('StartGame', 'player_id, bots', defaults=(0,))
+ReadyToReceiveGameState = namedtuple('ReadyToReceiveGameState',
+                                     'player_id, delta_updates',
+                                     defaults=(False,))
 PlayCardMsg = namedtuple('PlayCardMsg', 'player_id, card_id, picked_color')
 
 TYPE_KEY = 'message'
@@ -27,7 +32,8 @@ class MessageDeserializer(object):
         msg_type, msg_type_as_str = self._extract_message_type(msg)
 
         missing_fields = [field for field in msg_type._fields
-                          if field not in msg]
+                          if field not in msg and
+                          field not in msg_type._field_defaults]
         if missing_fields:
             raise ValueError("Invalid message: missing fields: " +
                              ', '.join(missing_fields) +
@@ -55,6 +61,20 @@ class MsgToSend(object):
         self.type = kwargs['message']
         self.content = json.dumps(kwargs)
 
+    @classmethod
+    def broadcast(cls, websockets, **kwargs) -> List['MsgToSend']:
+        content = json.dumps(kwargs)
+        return [cls._with_content(websocket, kwargs['message'], content)
+                for websocket in websockets]
+
+    @classmethod
+    def _with_content(cls, websocket, type: str, content: str):
+        msg = cls.__new__(cls)
+        msg.websocket = websocket
+        msg.type = type
+        msg.content = content
+        return msg
+
     def __eq__(self, other):
         return self.content == other.content and \
           self.websocket == other.websocket and \
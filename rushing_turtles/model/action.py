@@ -1,9 +1,11 @@
 from rushing_turtles.model.card import Card
+from rushing_turtles.model.turtle import COLORS, COLOR_IDS
 
 
 class Action(object):
+    __slots__ = ('card', 'color_id')
     card: Card
-    color: str
+    color_id: int
 
     def __init__(self, card: Card, color=None):
         if color and not card.is_rainbow():
@@ -17,15 +19,21 @@ class Action(object):
                 'Action color must be set on actions concerning ' +
                 'rainbow cards'
             )
+        if color and color not in COLOR_IDS:
+            raise ValueError(f'{color} turtle doesnt exist in this game')
 
         self.card = card
-        self.color = color
+        self.color_id = COLOR_IDS[color] if color else card.color_id
+
+    @property
+    def color(self) -> str:
+        return COLORS[self.color_id] if self.card.is_rainbow() else None
 
     def get_offset(self):
         return self.card.offset
 
     def get_color(self):
-        return self.color if self.card.is_rainbow() else self.card.color
+        return COLORS[self.color_id]
 
     def does_move_last_turtle(self):
-        return self.card.symbol in ['ARROW', 'ARROW_ARROW']
+        return self.card.is_arrow()
@@ -1,47 +1,159 @@
-from typing import List
+from typing import List, Dict, Tuple
+from collections import namedtuple
+from heapq import merge
 
-from rushing_turtles.model.turtle import Turtle
-from rushing_turtles.model.card import Card
+from rushing_turtles.model.turtle import Turtle, COLORS
+from rushing_turtles.model.card import Card, RAINBOW
 
 
 NUMBER_OF_FIELDS = 10
 
+MoveUndo = namedtuple(
+    'MoveUndo', 'count, from_pos, start_idx, removed_start_stack, to_pos')
+
+MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(seed: int) -> int:
+    z = (seed + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+# One key per (turtle, field, turtle directly below or none) feature. Keys
+# are generated on first use, so they don't limit the number of fields.
+ZOBRIST_KEYS = {}
+
+
+def _zobrist_key(turtle: Turtle, field: int, below: Turtle) -> int:
+    below_idx = below.color_id + 1 if below else 0
+    feature = (field * (len(COLORS) + 1) + below_idx) * len(COLORS) + \
+        turtle.color_id
+    if feature not in ZOBRIST_KEYS:
+        ZOBRIST_KEYS[feature] = _splitmix64(feature)
+    return ZOBRIST_KEYS[feature]
+
+
+PLAYABLE_KINDS = {}
+
+
+def _get_playable_kinds(present: int, off_start: int) -> int:
+    # bits of card kinds playable when turtles from the present color mask
+    # are on the board and these from off_start left the start field
+    key = (present, off_start)
+    if key not in PLAYABLE_KINDS:
+        kinds = 0
+        for color_id in range(len(COLORS)):
+            if present >> color_id & 1:
+                kinds |= 1 << 2 * color_id
+            if off_start >> color_id & 1:
+                kinds |= 1 << 2 * color_id + 1
+        if present:
+            kinds |= 1 << 2 * RAINBOW
+        if off_start:
+            kinds |= 1 << 2 * RAINBOW + 1
+        PLAYABLE_KINDS[key] = kinds
+    return PLAYABLE_KINDS[key]
+
 
 class Board(object):
+    __slots__ = ('start_field', 'further_fields', 'turtles', 'version',
+                 'positions', 'hash', 'number_of_fields', '_present_mask',
+                 '_off_start_mask', '_ranking', '_shared')
     start_field: List[List[Turtle]]
     further_fields: List[List[Turtle]]
     turtles: List[Turtle]
+    version: int
+    positions: Dict[Turtle, Tuple[int, int]]
+    hash: int
+    number_of_fields: int
+
+    def __init__(self, turtles: List[Turtle],
+                 number_of_fields: int = NUMBER_OF_FIELDS):
+        if number_of_fields < 2:
+            raise ValueError(
+                f'Board needs at least 2 fields, got {number_of_fields}')
 
-    def __init__(self, turtles):
-        assert NUMBER_OF_FIELDS >= 2
         self.turtles = turtles
+        self.number_of_fields = number_of_fields
         self.start_field = [[turtle] for turtle in turtles]
-        self.further_fields = [[] for _ in range(NUMBER_OF_FIELDS-1)]
+        self.further_fields = [[] for _ in range(number_of_fields - 1)]
+        self.version = 0
+        self.positions = {turtle: (0, 0) for turtle in turtles}
+        self.hash = self._compute_hash()
+        self._present_mask = self._get_mask(turtles)
+        self._off_start_mask = 0
+        self._ranking = self._compute_ranking()
+        self._shared = False
+
+    def clone(self) -> 'Board':
+        # stacks and positions are shared until one of the boards moves
+        # a turtle, the ranking list is never modified in place
+        board = Board.__new__(Board)
+        for slot in Board.__slots__:
+            setattr(board, slot, getattr(self, slot))
+        board._shared = self._shared = True
+        return board
+
+    def _ensure_not_shared(self) -> None:
+        if self._shared:
+            self.start_field = [list(stack) for stack in self.start_field]
+            self.further_fields = [list(stack)
+                                   for stack in self.further_fields]
+            self.positions = dict(self.positions)
+            self._shared = False
+
+    def _rebuild_indexes(self) -> None:
+        self._ensure_not_shared()
+        self._off_start_mask = 0
+        for stack in self.start_field:
+            self._index_stack_part(stack, 0, 0)
+        for field_idx, stack in enumerate(self.further_fields):
+            self._index_stack_part(stack, field_idx + 1, 0)
+        self.hash = self._compute_hash()
+        self._ranking = self._compute_ranking()
+
+    @staticmethod
+    def _get_mask(turtles: List[Turtle]) -> int:
+        mask = 0
+        for turtle in turtles:
+            mask |= 1 << turtle.color_id
+        return mask
+
+    def _compute_hash(self) -> int:
+        value = 0
+        fields = [(0, stack) for stack in self.start_field] + \
+            [(idx + 1, stack) for idx, stack in enumerate(self.further_fields)]
+        for field, stack in fields:
+            for idx, turtle in enumerate(stack):
+                below = stack[idx + 1] if idx + 1 < len(stack) else None
+                value ^= _zobrist_key(turtle, field, below)
+        return value
 
     def is_last(self, turtle: Turtle) -> bool:
-        if self._is_in_start_field(turtle):
-            return True
-
-        if self.start_field:
+        if turtle not in self.positions:
             return False
 
-        for stack in self.further_fields:
-            if stack:
-                return turtle in stack
+        last_pos = self.positions[self._ranking[-1]][0]
+        return self.positions[turtle][0] == last_pos
 
     def has_anyone_finished(self):
         return bool(self.further_fields[-1])
 
     def get_ranking(self):
-        return sorted(
-            self.turtles,
-            key=lambda x: (self._find_pos(x), self._find_height(x), x.color),
-            reverse=True
-        )
+        return list(self._ranking)
+
+    def _compute_ranking(self) -> List[Turtle]:
+        return sorted(self.turtles, key=self._get_rank_key, reverse=True)
+
+    def _get_rank_key(self, turtle: Turtle):
+        pos, height = self.positions[turtle]
+        return pos, height, turtle.color
 
     def _find_height(self, turtle: Turtle):
-        stack = self._find_stack(turtle)
-        return len(stack) - 1 - stack.index(turtle)
+        self._find_pos(turtle)
+        return self.positions[turtle][1]
 
     def _find_stack(self, turtle: Turtle):
         pos = self._find_pos(turtle)
@@ -52,51 +164,68 @@ class Board(object):
             return self._find_stack_in_start(turtle)[1]
 
     def move(self, turtle: Turtle, offset: int) -> None:
+        self.apply_move(turtle, offset)
+
+    def apply_move(self, turtle: Turtle, offset: int) -> MoveUndo:
+        self._ensure_not_shared()
         pos = self._find_pos(turtle)
         cliped_offset = self._clip(pos, offset)
 
         if pos == 0:
-            self._move_from_start(turtle, cliped_offset)
+            undo = self._move_from_start(turtle, cliped_offset)
+        else:
+            undo = self._move_from_further_fields(turtle, pos, cliped_offset)
+
+        self.version += 1
+        return undo
+
+    def undo_move(self, undo: MoveUndo) -> None:
+        self._ensure_not_shared()
+        if undo.to_pos == 0:
+            destination = self.start_field.pop()
         else:
-            self._move_from_further_fields(turtle, pos, cliped_offset)
+            destination = self.further_fields[undo.to_pos - 1]
+
+        if undo.from_pos > 0:
+            source = self.further_fields[undo.from_pos - 1]
+        elif undo.removed_start_stack:
+            source = []
+            self.start_field.insert(undo.start_idx, source)
+        else:
+            source = self.start_field[undo.start_idx]
+
+        self._put_on_top(destination, undo.count, source, undo.from_pos)
+        self.version += 1
 
     def _clip(self, pos, offset):
-        if pos + offset >= NUMBER_OF_FIELDS:
-            return NUMBER_OF_FIELDS - 1 - pos
+        if pos + offset >= self.number_of_fields:
+            return self.number_of_fields - 1 - pos
         else:
             return offset
 
     def _find_pos(self, turtle: Turtle) -> int:
-        if self._is_in_start_field(turtle):
-            return 0
-        else:
-            return self._find_pos_in_further_fields(turtle)
+        if turtle not in self.positions:
+            raise ValueError(f'Turtle {turtle} does not exist on the board')
+        return self.positions[turtle][0]
 
     def _is_in_start_field(self, turtle: Turtle) -> bool:
-        return any([turtle in stack for stack in self.start_field])
-
-    def _find_pos_in_further_fields(self, turtle: Turtle) -> List[Turtle]:
-        for idx_in_further_fields, stack in enumerate(self.further_fields):
-            if turtle in stack:
-                pos = idx_in_further_fields + 1
-                return pos
-
-        raise ValueError(f'Turtle {turtle} does not exist in further fields')
+        return turtle in self.positions and self.positions[turtle][0] == 0
 
-    def _move_from_start(self, turtle: Turtle, offset: int) -> None:
+    def _move_from_start(self, turtle: Turtle, offset: int) -> MoveUndo:
         if offset < 0:
             raise ValueError(
                 "Turtle can't move backward when it is in the start field")
 
         idx, stack = self._find_stack_in_start(turtle)
-        top_part, bottom_part = self._split_stack_on_turtle(stack, turtle)
-        self.further_fields[offset-1] = top_part + \
-            self.further_fields[offset-1]
+        count = self._count_turtles_to_move(stack, turtle)
+        new_pos = (offset - 1) % len(self.further_fields)
+        self._put_on_top(stack, count, self.further_fields[new_pos],
+                         new_pos + 1)
 
-        if bottom_part:
-            self.start_field[idx] = bottom_part
-        else:
-            self.start_field.remove(stack)
+        removed_start_stack = not stack
+        if removed_start_stack:
+            del self.start_field[idx]
+        return MoveUndo(count, 0, idx, removed_start_stack, new_pos + 1)
 
     def _find_stack_in_start(self, turtle: Turtle) -> List[Turtle]:
         for idx, stack in enumerate(self.start_field):
@@ -105,45 +234,83 @@ class Board(object):
 
         raise ValueError(f'Turtle {turtle} is not in the start field')
 
-    def _move_from_further_fields(self, turtle: Turtle, pos: int, offset: int):
-        pos_in_further_fields = pos - 1
-        stack = self.further_fields[pos_in_further_fields]
-        top_part, bottom_part = self._split_stack_on_turtle(stack, turtle)
-
-        new_pos = pos_in_further_fields + offset
-        self.further_fields[pos_in_further_fields] = bottom_part
+    def _move_from_further_fields(self, turtle: Turtle, pos: int,
+                                  offset: int) -> MoveUndo:
+        stack = self.further_fields[pos - 1]
+        count = self._count_turtles_to_move(stack, turtle)
+        new_pos = pos - 1 + offset
 
         if new_pos >= 0:
-            self.further_fields[new_pos] = top_part + \
-                self.further_fields[new_pos]
+            self._put_on_top(stack, count, self.further_fields[new_pos],
+                             new_pos + 1)
+            return MoveUndo(count, pos, 0, False, new_pos + 1)
         else:
-            self.start_field.append(top_part)
-
-    def _split_stack_on_turtle(self, stack: List[Turtle], turtle: int):
-        split_idx = stack.index(turtle)
-        top_part = stack[:split_idx+1]
-        bottom_part = stack[split_idx+1:]
-        return top_part, bottom_part
+            new_stack = []
+            self._put_on_top(stack, count, new_stack, 0)
+            self.start_field.append(new_stack)
+            return MoveUndo(count, pos, 0, False, 0)
+
+    def _count_turtles_to_move(self, stack: List[Turtle], turtle: Turtle):
+        return len(stack) - self.positions[turtle][1]
+
+    def _put_on_top(self, source: List[Turtle], count: int,
+                    destination: List[Turtle], pos: int):
+        moved = source[:count]
+        old_pos = self.positions[moved[0]][0]
+        old_below = source[count] if count < len(source) else None
+        del source[:count]
+        new_below = destination[0] if destination else None
+
+        self._rehash_stack_part(moved, old_pos, old_below, pos, new_below)
+        self._index_stack_part(moved, pos, len(destination))
+        self._rerank_stack_part(moved, pos)
+        destination[0:0] = moved
+
+    def _rerank_stack_part(self, part: List[Turtle], pos: int):
+        # the part lands on top of the stack at pos, so it goes right before
+        # the turtles which are not further than pos. In the start field
+        # stacks are side by side and the part is merged by height.
+        ranking = [turtle for turtle in self._ranking if turtle not in part]
+        idx = 0
+        while idx < len(ranking) and self.positions[ranking[idx]][0] > pos:
+            idx += 1
 
-    def is_move_with_card_possible(self, card: Card):
-        if not self.turtles:
-            return False
+        if pos > 0:
+            ranking[idx:idx] = part
+        else:
+            ranking[idx:] = merge(ranking[idx:], part,
+                                  key=self._get_rank_key, reverse=True)
+        self._ranking = ranking
+
+    def _rehash_stack_part(self, part: List[Turtle], old_pos: int,
+                           old_below: Turtle, new_pos: int, new_below: Turtle):
+        for idx, turtle in enumerate(part):
+            if idx + 1 < len(part):
+                old_below_turtle = new_below_turtle = part[idx + 1]
+            else:
+                old_below_turtle, new_below_turtle = old_below, new_below
+            self.hash ^= _zobrist_key(turtle, old_pos, old_below_turtle) ^ \
+                _zobrist_key(turtle, new_pos, new_below_turtle)
+
+    def _index_stack_part(self, part: List[Turtle], pos: int,
+                          base_height: int):
+        top_height = base_height + len(part) - 1
+        for idx, turtle in enumerate(part):
+            self.positions[turtle] = (pos, top_height - idx)
 
-        if card.is_rainbow():
-            return self._is_move_with_rainbow_card_possible(card)
+        if pos > 0:
+            self._off_start_mask |= self._get_mask(part)
         else:
-            return self._is_move_with_regular_card_possible(card)
+            self._off_start_mask &= ~self._get_mask(part)
 
-    def _is_move_with_rainbow_card_possible(self, card: Card):
-        return card.offset > 0 or self._can_move_any_turtle_backward()
+    def get_playable_kinds(self) -> int:
+        return _get_playable_kinds(self._present_mask, self._off_start_mask)
 
-    def _can_move_any_turtle_backward(self):
-        return max([self._find_pos(turtle) for turtle in self.turtles]) > 0
+    def is_move_with_card_possible(self, card: Card) -> bool:
+        return bool(card.kind & self.get_playable_kinds())
 
-    def _is_move_with_regular_card_possible(self, card: Card):
-        turtle = Turtle(card.color)
-        if turtle not in self.turtles:
-            return False
-        if card.offset < 0 and self._find_pos(turtle) == 0:
-            return False
-        return True
+    def is_move_with_any_card_possible(self, cards: List[Card]) -> bool:
+        kinds = 0
+        for card in cards:
+            kinds |= card.kind
+        return bool(kinds & self.get_playable_kinds())
@@ -1,33 +1,61 @@
 
-COLORS = ['RED', 'BLUE', 'GREEN', 'YELLOW', 'PURPLE', 'RAINBOW']
+from typing import Iterable, Tuple
+
+from rushing_turtles.model.turtle import COLORS as TURTLE_COLORS
+
+# Card colors share ids with turtle colors, rainbow comes last. Arrow
+# symbols come last so that they can be recognized by a single comparison.
+# Kind of a card is a single bit for its (color, moves backward) pair.
+COLORS = TURTLE_COLORS + ['RAINBOW']
+COLOR_IDS = {color: idx for idx, color in enumerate(COLORS)}
+RAINBOW = COLOR_IDS['RAINBOW']
+
+SYMBOLS = ['PLUS', 'PLUS_PLUS', 'MINUS', 'ARROW', 'ARROW_ARROW']
+SYMBOL_IDS = {symbol: idx for idx, symbol in enumerate(SYMBOLS)}
+ARROW = SYMBOL_IDS['ARROW']
+
 OFFSETS = {
   'PLUS': 1, 'PLUS_PLUS': 2, 'ARROW': 1, 'ARROW_ARROW': 2, 'MINUS': -1
 }
 
 
 class Card(object):
+    __slots__ = ('id', 'color_id', 'symbol_id', 'offset', 'kind')
     id: int
-    color: str
-    symbol: str
+    color_id: int
+    symbol_id: int
     offset: int
+    kind: int
 
     def __init__(self, id, color, symbol):
-        if color not in COLORS:
+        if color not in COLOR_IDS:
             raise ValueError(f'Wrong card color: {color}')
 
-        if symbol not in OFFSETS.keys():
+        if symbol not in SYMBOL_IDS:
             raise ValueError(f'Wrong card symbol: {symbol}')
 
-        if symbol in ['ARROW', 'ARROW_ARROW'] and color != 'RAINBOW':
+        if SYMBOL_IDS[symbol] >= ARROW and color != 'RAINBOW':
             raise ValueError('Only rainbow cards can have arrows symbol')
 
         self.id = id
-        self.color = color
-        self.symbol = symbol
+        self.color_id = COLOR_IDS[color]
+        self.symbol_id = SYMBOL_IDS[symbol]
         self.offset = OFFSETS[symbol]
+        self.kind = 1 << (2 * self.color_id + (self.offset < 0))
+
+    @property
+    def color(self) -> str:
+        return COLORS[self.color_id]
+
+    @property
+    def symbol(self) -> str:
+        return SYMBOLS[self.symbol_id]
 
     def is_rainbow(self):
-        return self.color == 'RAINBOW'
+        return self.color_id == RAINBOW
+
+    def is_arrow(self):
+        return self.symbol_id >= ARROW
 
     def __eq__(self, other):
         return self.id == other.id
@@ -37,3 +65,28 @@ class Card(object):
 
     def __repr__(self):
         return f'Card(id={self.id}, color={self.color}, symbol={self.symbol})'
+
+
+class CardCatalog(object):
+    __slots__ = ('cards', '_indexes')
+    cards: Tuple[Card, ...]
+
+    def __init__(self, cards: Iterable[Card]):
+        self.cards = tuple(cards)
+        self._indexes = {card.id: idx for idx, card in enumerate(self.cards)}
+
+    def get_index(self, id: int) -> int:
+        try:
+            return self._indexes[id]
+        except KeyError:
+            raise ValueError(
+                f'Card with id {id} does not exist in this game') from None
+
+    def get_card(self, id: int) -> Card:
+        return self.cards[self.get_index(id)]
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, idx: int) -> Card:
+        return self.cards[idx]
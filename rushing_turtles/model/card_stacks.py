@@ -1,53 +1,129 @@
 import random
 
-from typing import List, Deque
-from collections import deque
+from typing import List, Sequence
+from array import array
 
-from rushing_turtles.model.card import Card
+from rushing_turtles.model.card import Card, CardCatalog
 
 
 class CardStacks(object):
-    played_cards: Deque[Card]
-    available_cards: Deque[Card]
+    __slots__ = ('cards', 'reshuffles', 'rng', '_draw_pile', '_draw_cursor',
+                 '_draw_end', '_discard_pile', '_discard_top', '_shared',
+                 '_rng_shared')
+    cards: CardCatalog
+    reshuffles: int
 
-    def __init__(self, available_cards: List[Card]):
-        self.available_cards = deque(available_cards)
-        self.played_cards = deque()
+    def __init__(self, available_cards: Sequence[Card], rng=random,
+                 order: Sequence[int] = None):
+        # Both piles are preallocated arrays of indexes into cards. The draw
+        # pile is _draw_pile[_draw_cursor:_draw_end], the discard pile is
+        # _discard_pile[_discard_top:] with the most recent card first.
+        self.cards = available_cards \
+            if isinstance(available_cards, CardCatalog) \
+            else CardCatalog(available_cards)
+        if order is None:
+            order = range(len(self.cards))
+        self._draw_pile = array('H', order)
+        self._draw_cursor = 0
+        self._draw_end = len(self.cards)
+        self._discard_pile = array('H', range(len(self.cards)))
+        self._discard_top = len(self.cards)
+        self.reshuffles = 0
+        self.rng = rng
+        self._shared = False
+        self._rng_shared = False
+
+    def clone(self) -> 'CardStacks':
+        # piles are shared until one of the stacks puts a card or
+        # reshuffles (drawing moves only the cursor), the random generator
+        # until one of them reshuffles
+        stacks = CardStacks.__new__(CardStacks)
+        for slot in CardStacks.__slots__:
+            setattr(stacks, slot, getattr(self, slot))
+        stacks._shared = self._shared = True
+        stacks._rng_shared = self._rng_shared = True
+        return stacks
+
+    def _ensure_not_shared(self) -> None:
+        if self._shared:
+            self._draw_pile = array('H', self._draw_pile)
+            self._discard_pile = array('H', self._discard_pile)
+            self._shared = False
+
+    def _ensure_rng_not_shared(self) -> None:
+        if self._rng_shared:
+            rng = random.Random()
+            rng.setstate(self.rng.getstate())
+            self.rng = rng
+            self._rng_shared = False
+
+    @property
+    def available_cards(self) -> List[Card]:
+        return [self.cards[idx] for idx
+                in self._draw_pile[self._draw_cursor:self._draw_end]]
+
+    @property
+    def played_cards(self) -> List[Card]:
+        return [self.cards[idx] for idx
+                in self._discard_pile[self._discard_top:]]
 
     def put(self, card: Card) -> None:
-        self.played_cards.appendleft(card)
+        if self._shared:
+            self._ensure_not_shared()
+        self._discard_top -= 1
+        self._discard_pile[self._discard_top] = self.cards.get_index(card.id)
 
     def get_recent(self) -> Card:
-        if not self.played_cards:
+        if self._discard_top == len(self._discard_pile):
             return None
-        return self.played_cards[0]
+        return self.cards[self._discard_pile[self._discard_top]]
 
     def get_new(self) -> Card:
-        return self.get_new_cards(1)[0]
+        if self._draw_cursor == self._draw_end:
+            self._ensure_enough_available_cards(1)
+
+        idx = self._draw_pile[self._draw_cursor]
+        self._draw_cursor += 1
+        return self.cards.cards[idx]
 
     def get_new_cards(self, cnt: int) -> List[Card]:
+        self._ensure_enough_available_cards(cnt)
+
+        first = self._draw_cursor
+        self._draw_cursor += cnt
+        return list(map(self.cards.cards.__getitem__,
+                        self._draw_pile[first:self._draw_cursor]))
+
+    def _ensure_enough_available_cards(self, cnt):
         if not self._has_enough_available_cards(cnt):
             self._reshuffle()
 
         if not self._has_enough_available_cards(cnt):
-            available_cards_cnt = len(self.available_cards)
+            available_cards_cnt = self._draw_end - self._draw_cursor
             raise ValueError(
                 f'Too many cards requested ({cnt}).' +
                 f'There are only {available_cards_cnt} cards available.'
             )
 
-        return [self.available_cards.popleft() for _ in range(cnt)]
-
     def _has_enough_available_cards(self, cnt):
-        return len(self.available_cards) >= cnt
+        return self._draw_end - self._draw_cursor >= cnt
 
     def _reshuffle(self) -> None:
-        if self.played_cards:
-            recently_played_card = self.played_cards.popleft()
-            self.available_cards = self._shuffle_cards(self.played_cards)
-            self.played_cards = deque([recently_played_card])
-
-    def _shuffle_cards(self, cards: Deque[Card]) -> Deque[Card]:
-        cards_list = list(cards)
-        random.shuffle(cards_list)
-        return deque(cards_list)
+        size = len(self._discard_pile)
+        if self._discard_top == size:
+            return
+
+        self._ensure_not_shared()
+        self._ensure_rng_not_shared()
+        # all played cards but the most recent one become the draw pile,
+        # shuffled in place through a view over the preallocated array
+        cnt = size - self._discard_top - 1
+        draw_pile = memoryview(self._draw_pile)[:cnt]
+        draw_pile[:] = memoryview(self._discard_pile)[self._discard_top + 1:]
+        self.rng.shuffle(draw_pile)
+        self._draw_cursor = 0
+        self._draw_end = cnt
+
+        self._discard_pile[size - 1] = self._discard_pile[self._discard_top]
+        self._discard_top = size - 1
+        self.reshuffles += 1
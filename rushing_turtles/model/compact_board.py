@@ -0,0 +1,91 @@
+from array import array
+from typing import List
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+# Every color from COLORS takes three unsigned shorts in the state: field
+# (0 is the start field), index of the stack in the start field (0 outside
+# of it) and height counted from the bottom of the stack.
+SLOTS_PER_TURTLE = 3
+ABSENT = 0xFFFF
+
+
+class CompactBoard(object):
+    __slots__ = ('number_of_fields', 'state')
+    number_of_fields: int
+    state: bytes
+
+    def __init__(self, number_of_fields: int, state: bytes):
+        self.number_of_fields = number_of_fields
+        self.state = state
+
+    @classmethod
+    def from_board(cls, board: Board) -> 'CompactBoard':
+        slots = array('H', [ABSENT]) * (SLOTS_PER_TURTLE * len(COLORS))
+
+        for start_idx, stack in enumerate(board.start_field):
+            cls._encode_stack(slots, stack, 0, start_idx)
+        for turtle, (field, height) in board.positions.items():
+            if field > 0:
+                offset = SLOTS_PER_TURTLE * turtle.color_id
+                slots[offset] = field
+                slots[offset + 1] = 0
+                slots[offset + 2] = height
+
+        return cls(board.number_of_fields, slots.tobytes())
+
+    @staticmethod
+    def _encode_stack(slots: array, stack: List[Turtle], field: int,
+                      start_idx: int):
+        for idx, turtle in enumerate(stack):
+            offset = SLOTS_PER_TURTLE * turtle.color_id
+            slots[offset] = field
+            slots[offset + 1] = start_idx
+            slots[offset + 2] = len(stack) - 1 - idx
+
+    def to_board(self) -> Board:
+        slots = array('H')
+        slots.frombytes(self.state)
+
+        turtles, start_stacks, further_stacks = [], {}, {}
+        for color_idx, color in enumerate(COLORS):
+            field, start_idx, height = \
+                slots[SLOTS_PER_TURTLE * color_idx:
+                      SLOTS_PER_TURTLE * (color_idx + 1)]
+            if field == ABSENT:
+                continue
+
+            turtle = Turtle(color)
+            turtles.append(turtle)
+            stacks, key = (start_stacks, start_idx) if field == 0 \
+                else (further_stacks, field - 1)
+            stacks.setdefault(key, {})[height] = turtle
+
+        board = Board(turtles, self.number_of_fields)
+
+        board.start_field = [self._to_stack(start_stacks[idx])
+                             for idx in sorted(start_stacks)]
+        for field_idx, turtles_by_height in further_stacks.items():
+            board.further_fields[field_idx] = \
+                self._to_stack(turtles_by_height)
+        board._rebuild_indexes()
+        return board
+
+    @staticmethod
+    def _to_stack(turtles_by_height) -> List[Turtle]:
+        return [turtles_by_height[height]
+                for height in sorted(turtles_by_height, reverse=True)]
+
+    def copy(self) -> 'CompactBoard':
+        return CompactBoard(self.number_of_fields, self.state)
+
+    def __eq__(self, other):
+        return self.number_of_fields == other.number_of_fields and \
+            self.state == other.state
+
+    def __hash__(self):
+        return hash((self.number_of_fields, self.state))
+
+    def __repr__(self):
+        return f'CompactBoard({self.number_of_fields}, {self.state.hex()})'
@@ -2,45 +2,65 @@ import random
 
 from typing import List
 from itertools import repeat, chain, product
+from collections import namedtuple
 
-from rushing_turtles.model.card import Card
+from rushing_turtles.model.card import Card, CardCatalog
 from rushing_turtles.model.player import Player
-from rushing_turtles.model.board import Board
+from rushing_turtles.model.board import Board, NUMBER_OF_FIELDS
 from rushing_turtles.model.action import Action
 from rushing_turtles.model.card_stacks import CardStacks
 from rushing_turtles.model.person import Person
-from rushing_turtles.model.turtle import Turtle
+from rushing_turtles.model.turtle import Turtle, COLORS
 
 HAND_SIZE = 5
+TURTLE_COLORS = ['RED', 'GREEN', 'BLUE', 'PURPLE', 'YELLOW']
+CARD_COLORS = ['BLUE', 'RED', 'GREEN', 'YELLOW', 'PURPLE']
+
+HistoryEntry = namedtuple('HistoryEntry', 'person_id, card_id, color')
 
 
 class Game(object):
-    cards: List[Card]
+    __slots__ = ('rng', 'seed', 'history', 'cards', 'stacks', 'turtles',
+                 'board', 'players', 'active_player', 'version',
+                 '_history_shared')
+    cards: CardCatalog
     stacks: CardStacks
     turtles: List[Turtle]
     board: Board
     players: List[Player]
     active_player: Player
+    version: int
+    seed: int
+    history: List[HistoryEntry]
 
     def __init__(self, people: List[Person], turtles: List[Turtle],
-                 cards: List[Card]):
+                 cards: List[Card], rng=random, seed: int = None,
+                 order: List[int] = None,
+                 number_of_fields: int = NUMBER_OF_FIELDS):
         if len(people) < 2:
             raise ValueError(
                 'There are at least 2 players required to start the game')
+        if len(turtles) < len(people):
+            raise ValueError(f'Not enough turtles for {len(people)} players')
         if len(cards) < HAND_SIZE * len(people):
             raise ValueError(f'Not enough cards for {len(people)} players')
 
-        self.cards = cards
-        self.stacks = CardStacks(cards)
+        self.rng = rng
+        self.seed = seed
+        self.history = []
+        self.stacks = CardStacks(cards, rng, order)
+        self.cards = self.stacks.cards
         self.turtles = turtles
-        self.board = Board(turtles)
+        self.board = Board(turtles, number_of_fields)
         self.players = self._init_players(people, turtles)
         self.active_player = self.players[0]
+        self.version = 0
+        self._history_shared = False
 
         self._ensure_player_can_move(self.active_player)
 
     def _init_players(self, people: List[Person], turtles: List[Turtle]):
-        random.shuffle(turtles)
+        self.rng.shuffle(turtles)
         return [self._init_player(person, turtle)
                 for person, turtle in zip(people, turtles)]
 
@@ -52,8 +72,35 @@ class Game(object):
             player.cards = self.stacks.get_new_cards(HAND_SIZE)
 
     def _can_player_move(self, player: Player):
-        return any([self.board.is_move_with_card_possible(card)
-                    for card in player.cards])
+        return self.board.is_move_with_any_card_possible(player.cards)
+
+    def get_legal_actions(self, person: Person) -> List[Action]:
+        cards = self._find_player(person).cards
+        return list_legal_actions(self.board, self.turtles, cards)
+
+    def clone(self) -> 'Game':
+        # cards, turtles and people are shared, the board, stacks, hands and
+        # history are copied by the clones on their first write
+        game = Game.__new__(Game)
+        game.rng = self.rng
+        game.seed = self.seed
+        game.history = self.history
+        game.cards = self.cards
+        game.stacks = self.stacks.clone()
+        game.turtles = self.turtles
+        game.board = self.board.clone()
+        game.players = [player.clone() for player in self.players]
+        game.active_player = game.players[
+            self._find_player_idx(self.active_player)]
+        game.version = self.version
+        game._history_shared = self._history_shared = True
+        return game
+
+    def _record(self, entry: HistoryEntry):
+        if self._history_shared:
+            self.history = list(self.history)
+            self._history_shared = False
+        self.history.append(entry)
 
     def play(self, person: Person, action: Action) -> None:
         player = self._find_player(person)
@@ -64,6 +111,8 @@ class Game(object):
 
         self._move_turtle(action)
         self._update_player_cards_and_stacks(player, action)
+        self._record(HistoryEntry(person.id, action.card.id, action.color))
+        self.version += 1
 
         if self._has_winner():
             return self._get_ranking()
@@ -78,7 +127,7 @@ class Game(object):
         raise ValueError(f'Person {person} does not play in this game')
 
     def _move_turtle(self, action: Action):
-        turtle = self._find_turtle(action.get_color())
+        turtle = self._find_turtle(action.color_id)
         if action.does_move_last_turtle() and not self.board.is_last(turtle):
             raise ValueError(
                 'Arrow card can move only the last turtle.' +
@@ -87,17 +136,15 @@ class Game(object):
 
         self.board.move(turtle, action.get_offset())
 
-    def _find_turtle(self, color: str):
+    def _find_turtle(self, color_id: int):
         for turtle in self.turtles:
-            if turtle.color == color:
+            if turtle.color_id == color_id:
                 return turtle
-        raise ValueError(f'{color} turtle doesnt exist in this game')
+        raise ValueError(
+            f'{COLORS[color_id]} turtle doesnt exist in this game')
 
     def get_card(self, id: int):
-        for card in self.cards:
-            if card.id == id:
-                return card
-        raise ValueError(f'Card with id {id} does not exist in this game')
+        return self.cards.get_card(id)
 
     def _update_player_cards_and_stacks(self, player: Player, action: Action):
         self.stacks.put(action.card)
@@ -137,6 +184,9 @@ class Game(object):
                 return idx
         raise ValueError(f'Person {person} is not in this game')
 
+    def get_state_version(self):
+        return self.version, self.board.version
+
     def get_persons_cards(self, person: Person):
         player = self._find_player(person)
         return player.cards
@@ -147,18 +197,67 @@ class Game(object):
         if self.active_player == player:
             self._change_active_player()
         self.players.remove(player)
-
-
-def create_game(people: List[Person]):
-    turtles = [Turtle('RED'), Turtle('GREEN'), Turtle('BLUE'),
-               Turtle('PURPLE'), Turtle('YELLOW')]
-    cards = create_cards()
-    random.shuffle(cards)
-    return Game(people, turtles, cards)
-
-
-def create_cards():
-    colors = ['BLUE', 'RED', 'GREEN', 'YELLOW', 'PURPLE']
+        self._record(HistoryEntry(person.id, None, None))
+        self.version += 1
+
+
+def list_legal_actions(board: Board, turtles: List[Turtle],
+                       cards: List[Card]) -> List[Action]:
+    # whether every turtle can be moved by an arrow card and by a card
+    # with a negative offset is checked once for the whole hand
+    movable = [(turtle, board.is_last(turtle),
+                board.positions[turtle][0] > 0)
+               for turtle in turtles]
+
+    actions = []
+    for card in cards:
+        arrow, backward = card.is_arrow(), card.offset < 0
+        for turtle, is_last, off_start in movable:
+            if not card.is_rainbow() and card.color_id != turtle.color_id:
+                continue
+            if (arrow and not is_last) or (backward and not off_start):
+                continue
+            color = turtle.color if card.is_rainbow() else None
+            actions.append(Action(card, color))
+    return actions
+
+
+def create_game(people: List[Person], seed: int = None,
+                number_of_fields: int = NUMBER_OF_FIELDS,
+                colors: List[str] = None):
+    # every game gets its own seed, so it can be replayed from the history
+    if seed is None:
+        seed = random.getrandbits(64)
+    rng = random.Random(seed)
+    turtles = [Turtle(color) for color in colors or TURTLE_COLORS]
+    cards = _get_catalog(colors) if colors else CARDS
+    order = list(range(len(cards)))
+    rng.shuffle(order)
+    return Game(people, turtles, cards, rng, seed, order, number_of_fields)
+
+
+def _get_catalog(colors: List[str]) -> CardCatalog:
+    key = tuple(colors)
+    if key not in CATALOGS:
+        CATALOGS[key] = CardCatalog(create_cards(colors))
+    return CATALOGS[key]
+
+
+def replay_game(people: List[Person], seed: int,
+                history: List[HistoryEntry], **config) -> Game:
+    game = create_game(people, seed, **config)
+    people_by_id = {person.id: person for person in people}
+    for entry in history:
+        person = people_by_id[entry.person_id]
+        if entry.card_id is None:
+            game.remove_player(person)
+        else:
+            game.play(person, Action(game.get_card(entry.card_id),
+                                     entry.color))
+    return game
+
+
+def create_cards(colors: List[str] = CARD_COLORS):
     actions = ['PLUS_PLUS', 'PLUS', 'MINUS', 'ARROW', 'ARROW_ARROW']
 
     regular_repetitions = [1, 5, 2, 0, 0]
@@ -181,3 +280,7 @@ def create_cards():
     return [Card(idx, color, symbol)
             for idx, (color, symbol)
             in enumerate(all_combinations)]
+
+
+CARDS = CardCatalog(create_cards())
+CATALOGS = {}
@@ -1,5 +1,6 @@
 
 class Person(object):
+    __slots__ = ('id', 'name', 'websocket')
     id: int
     name: str
 
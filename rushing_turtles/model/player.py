@@ -6,6 +6,7 @@ from rushing_turtles.model.card import Card
 
 
 class Player(object):
+    __slots__ = ('person', 'turtle', 'cards', '_shared')
     person: Person
     turtle: Turtle
     cards: List[Card]
@@ -14,17 +15,30 @@ class Player(object):
         self.person = person
         self.turtle = turtle
         self.cards = cards
+        self._shared = False
+
+    def clone(self) -> 'Player':
+        player = Player(self.person, self.turtle, self.cards)
+        player._shared = self._shared = True
+        return player
+
+    def _ensure_not_shared(self):
+        if self._shared:
+            self.cards = list(self.cards)
+            self._shared = False
 
     def has_card(self, card: Card):
         return card in self.cards
 
     def add_card(self, card: Card):
+        self._ensure_not_shared()
         self.cards.insert(0, card)
 
     def remove_card(self, card: Card):
         if card not in self.cards:
             raise ValueError(
                 f"Player {self.person} doesn't have given card ({card})")
+        self._ensure_not_shared()
         self.cards.remove(card)
 
     def __repr__(self):
@@ -1,20 +1,26 @@
 
 COLORS = ['RED', 'BLUE', 'GREEN', 'YELLOW', 'PURPLE']
+COLOR_IDS = {color: idx for idx, color in enumerate(COLORS)}
 
 
 class Turtle(object):
-    color: str
+    __slots__ = ('color_id',)
+    color_id: int
 
     def __init__(self, color):
-        if color not in COLORS:
+        if color not in COLOR_IDS:
             raise ValueError(f'Invalid color: {color}')
-        self.color = color
+        self.color_id = COLOR_IDS[color]
+
+    @property
+    def color(self) -> str:
+        return COLORS[self.color_id]
 
     def __eq__(self, other):
-        return self.color == other.color
+        return self.color_id == other.color_id
 
     def __hash__(self):
-        return hash(self.color)
+        return self.color_id
 
     def __repr__(self):
         return self.color
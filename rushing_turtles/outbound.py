@@ -0,0 +1,87 @@
+import asyncio
+import logging
+
+from rushing_turtles.messages import MsgToSend
+
+DROP_OLDEST = 'drop-oldest'
+DISCONNECT = 'disconnect'
+BLOCK = 'block'
+OVERFLOW_POLICIES = [DROP_OLDEST, DISCONNECT, BLOCK]
+
+
+class OutboundQueue(object):
+    size: int
+    policy: str
+    dropped: int
+    closed: bool
+
+    def __init__(self, websocket, size: int, policy: str,
+                 send_timeout: float):
+        if size < 1:
+            raise ValueError(f'Outbound queue size must be positive: {size}')
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy: {policy}')
+
+        self.websocket = websocket
+        self.size = size
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.dropped = 0
+        self.closed = False
+        self._queue = asyncio.Queue(size)
+        self._writer = asyncio.ensure_future(self._write())
+
+    def get_depth(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, msg: MsgToSend) -> None:
+        if self.closed:
+            self.dropped += 1
+            return
+
+        if self.policy == BLOCK:
+            await self._queue.put(msg)
+            return
+
+        if self._queue.full():
+            if self.policy == DROP_OLDEST:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+            else:
+                self._overflowed()
+                return
+
+        self._queue.put_nowait(msg)
+
+    def _overflowed(self):
+        logging.warning(f'Outbound queue of {self.websocket} overflowed ' +
+                        f'({self.size} messages), disconnecting')
+        self.dropped += self._queue.qsize() + 1
+        self.close()
+        asyncio.ensure_future(self.websocket.close())
+
+    async def _write(self):
+        while True:
+            msg = await self._queue.get()
+            try:
+                await asyncio.wait_for(msg.send(), self.send_timeout)
+            except asyncio.TimeoutError:
+                logging.warning(f'Sending {msg.type} to {self.websocket} ' +
+                                'exceeded the deadline of ' +
+                                f'{self.send_timeout}s')
+            except Exception as e:
+                logging.error(f'Could not send {msg.type} to ' +
+                              f'{self.websocket}: {e}')
+            finally:
+                self._queue.task_done()
+
+    async def flush(self) -> None:
+        await self._queue.join()
+
+    def close(self) -> None:
+        self.closed = True
+        self._writer.cancel()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
@@ -0,0 +1,520 @@
+import logging
+
+from typing import List
+from collections import namedtuple
+
+from rushing_turtles.messages import MsgToSend
+from rushing_turtles.messages import HelloServerMsg
+from rushing_turtles.messages import WantToJoinMsg
+from rushing_turtles.messages import StartGameMsg
+from rushing_turtles.messages import ReadyToReceiveGameState
+from rushing_turtles.messages import PlayCardMsg
+from rushing_turtles.model.person import Person
+from rushing_turtles.model.game import create_game
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.card import Card
+from rushing_turtles.model.action import Action
+from rushing_turtles.bots.mcts import SearchState, get_search_state
+
+
+MAX_PLAYERS_IN_ROOM = 5
+
+BotTurn = namedtuple('BotTurn', 'person_id, game, version')
+
+
+class BotConnection(object):
+    # Stands in for the websocket of a seat played by a bot, messages
+    # addressed to the bot are dropped
+
+    async def send(self, content):
+        pass
+
+    async def close(self):
+        pass
+
+    def __repr__(self):
+        return 'bot'
+
+
+class Room(object):
+
+    def __init__(self, id, bot_takeover: bool = False):
+        self.id = id
+        self.bot_takeover = bot_takeover
+        self.bots = set()
+        self.synthetic_bots = set()
+        self.departed = set()
+        self.people = {}
+        self.people_by_websocket = {}
+        self.players = {}
+        self.game = None
+        self.delta_subscribers = set()
+        self._game_state_cache = None
+        self._delta_base = None
+
+    def is_empty(self):
+        return not self.people and not self.players
+
+    def has_person(self, id: int):
+        return id in self.people
+
+    def handle(self, msg, websocket) -> List[MsgToSend]:
+        if isinstance(msg, HelloServerMsg):
+            return self._handle_hello_server(msg, websocket)
+        elif isinstance(msg, WantToJoinMsg):
+            return self._handle_want_to_join(msg, websocket)
+        elif isinstance(msg, StartGameMsg):
+            return self._handle_start_game(msg, websocket)
+        elif isinstance(msg, ReadyToReceiveGameState):
+            return self._handle_ready_to_receive_game_state(msg, websocket)
+        elif isinstance(msg, PlayCardMsg):
+            return self._handle_play_card(msg, websocket)
+        else:
+            logging.warning(f'Unhandled message: {msg}')
+
+    def _handle_hello_server(self, msg: HelloServerMsg, websocket):
+        if msg.player_id in self.synthetic_bots:
+            raise ValueError(f'Person with id = {msg.player_id} is a bot')
+        if self._is_person_already_connected(msg.player_id):
+            raise ValueError(f'Person with id = {msg.player_id} is already' +
+                             'connected to the server')
+
+        person = self.people.get(msg.player_id)
+        if person:
+            person.websocket = websocket
+            self.bots.discard(person.id)
+        else:
+            person = Person(msg.player_id, msg.player_name, websocket)
+            self.people[person.id] = person
+        self.people_by_websocket[websocket] = person
+
+        if not self.players:
+            return MsgToSend(
+                websocket,
+                message='hello client',
+                status='can create',
+                list_of_players_in_room=[])
+        elif person.id in self.players:
+            return MsgToSend(
+                websocket,
+                message='hello client',
+                status='can resume',
+                list_of_players_in_room=self._get_names_of_players_in_room())
+        elif not self.game and len(self.players) < MAX_PLAYERS_IN_ROOM:
+            return MsgToSend(
+                websocket,
+                message='hello client',
+                status='can join',
+                list_of_players_in_room=self._get_names_of_players_in_room())
+        elif self.game:
+            return MsgToSend(
+                websocket,
+                message='hello client',
+                status='ongoing',
+                list_of_players_in_room=self._get_names_of_players_in_room())
+        else:
+            return MsgToSend(
+                websocket,
+                message='hello client',
+                status='limit',
+                list_of_players_in_room=self._get_names_of_players_in_room())
+
+    def _is_person_already_connected(self, id: int):
+        person = self.people.get(id)
+        return person is not None and person.is_connected() and \
+            id not in self.bots
+
+    def _handle_want_to_join(self, msg: WantToJoinMsg, websocket):
+        pid = msg.player_id
+        person = self._find_person(pid)
+        self._ensure_that_player_not_poses_as_sb_else(person, websocket)
+
+        if len(self.players) >= MAX_PLAYERS_IN_ROOM:
+            raise ValueError('Room is full')
+        if person.id in self.players:
+            raise ValueError(f'Person {person} is already in the room')
+        if self.game:
+            raise ValueError('Game has already started')
+
+        self.players[person.id] = person
+        return self._broadcast_room_update() + \
+            self._broadcast_can_join_outside_room()
+
+    def _ensure_that_player_not_poses_as_sb_else(self, person, websocket):
+        if person.websocket != websocket:
+            raise ValueError(f"You can't play as player {person} - " +
+                             "he is already controlled by someone else")
+
+    def _broadcast_room_update(self):
+        return self._broadcast(
+            message='room update',
+            list_of_players_in_room=self._get_names_of_players_in_room()
+        )
+
+    def _broadcast(self, **kwargs):
+        return MsgToSend.broadcast(
+            [person.websocket for person in self.people.values()
+             if person.is_connected()],
+            **kwargs
+        )
+
+    def _get_names_of_players_in_room(self):
+        return [person.name for person in self.players.values()]
+
+    def _broadcast_can_join_outside_room(self):
+        return self._broadcast_outside_room(
+            message='hello client',
+            status='can join',
+            list_of_players_in_room=self._get_names_of_players_in_room()
+        )
+
+    def _broadcast_outside_room(self, **kwargs):
+        return MsgToSend.broadcast(
+            [person.websocket for person in self.people.values()
+             if person.id not in self.players and person.is_connected()],
+            **kwargs
+        )
+
+    def _find_person(self, id: int):
+        if id not in self.people:
+            raise ValueError(f'Person with id = {id} is not connected')
+        return self.people[id]
+
+    def _handle_start_game(self, msg: StartGameMsg, websocket):
+        pid = msg.player_id
+        person = self._find_person(pid)
+        self._ensure_that_player_not_poses_as_sb_else(person, websocket)
+
+        if person.id not in self.players:
+            raise ValueError(f'Person {person} is not in the room')
+        if self._get_first_player() != person:
+            raise ValueError(
+                f'Person {person} is not the first player in the room' +
+                ' so he cannot start the game')
+        if not isinstance(msg.bots, int) or isinstance(msg.bots, bool) or \
+                msg.bots < 0 or \
+                len(self.players) + msg.bots > MAX_PLAYERS_IN_ROOM:
+            raise ValueError(f'Invalid number of bots: {msg.bots}')
+
+        # bots get negative ids that nobody in the room uses
+        bot_id = -1
+        for idx in range(1, msg.bots + 1):
+            while bot_id in self.people:
+                bot_id -= 1
+            self._add_bot(Person(bot_id, f'Bot {idx}', BotConnection()))
+        self.game = create_game(list(self.players.values()))
+        return self._emit_ongoing_to_players_outside_the_room() + \
+            self._emit_game_ready_to_start_to_players_in_room()
+
+    def _add_bot(self, person: Person):
+        self.people[person.id] = person
+        self.players[person.id] = person
+        self.bots.add(person.id)
+        self.synthetic_bots.add(person.id)
+
+    def _get_first_player(self):
+        return next(iter(self.players.values()))
+
+    def _emit_ongoing_to_players_outside_the_room(self):
+        return self._broadcast_outside_room(
+            message='hello client',
+            status='ongoing',
+            list_of_players_in_room=self._get_names_of_players_in_room()
+        )
+
+    def _emit_game_ready_to_start_to_players_in_room(self):
+        return [
+            MsgToSend(
+                person.websocket,
+                message='game ready to start',
+                player_idx=self.game.get_person_idx(person)
+            ) for person in self.players.values()
+        ]
+
+    def _handle_ready_to_receive_game_state(self, msg: ReadyToReceiveGameState,
+                                            websocket):
+        pid = msg.player_id
+        person = self._find_person(pid)
+        self._ensure_that_player_not_poses_as_sb_else(person, websocket)
+        if not self.game:
+            raise ValueError('Game has not started yet')
+
+        player = self.game._find_player(person)
+        state = self._get_game_state()
+        versioning = {}
+        if msg.delta_updates:
+            self.delta_subscribers.add(person.id)
+            versioning['version'] = self._get_wire_version()
+            self._init_delta_base(state)
+        else:
+            self.delta_subscribers.discard(person.id)
+
+        return MsgToSend(
+            websocket,
+            message='full game state',
+            board=state['board'],
+            players_names=self._get_names_of_players_in_room(),
+            active_player_idx=state['active_player_idx'],
+            player_cards=[self._card_to_dict(card) for card in player.cards],
+            legal_moves=self._get_legal_moves(person),
+            player_turtle_color=player.turtle.color,
+            recently_played_card=state['recently_played_card'],
+            **versioning
+        )
+
+    def _get_wire_version(self):
+        return sum(self.game.get_state_version())
+
+    def _init_delta_base(self, state):
+        if not self._delta_base or self._delta_base[0] is not self.game:
+            self._delta_base = (self.game, self._get_wire_version(), state)
+
+    def _get_game_state(self):
+        version = self.game.get_state_version()
+        if self._game_state_cache:
+            game, cached_version, state = self._game_state_cache
+            if game is self.game and cached_version == version:
+                return state
+
+        state = {
+            'board': self._board_to_dict(self.game.board),
+            'active_player_idx': self.game._find_player_idx(
+                self.game.active_player),
+            'recently_played_card': self._card_to_dict(
+                self.game.stacks.get_recent())
+        }
+        self._game_state_cache = (self.game, version, state)
+        return state
+
+    def _board_to_dict(self, board: Board):
+        return {
+            'turtles_in_game_positions': [
+                list(reversed([str(turtle) for turtle in stack]))
+                for stack in board.further_fields
+            ],
+            'turtles_on_start_positions': [
+                list(reversed([str(turtle) for turtle in stack]))
+                for stack in board.start_field
+            ]
+        }
+
+    def _card_to_dict(self, card: Card):
+        if not card:
+            return None
+        return {'card_id': card.id, 'color': card.color, 'action': card.symbol}
+
+    def _get_legal_moves(self, person: Person):
+        return [{'card_id': action.card.id, 'picked_color': action.color}
+                for action in self.game.get_legal_actions(person)]
+
+    def _handle_play_card(self, msg: PlayCardMsg, websocket):
+        pid = msg.player_id
+        person = self._find_person(pid)
+        self._ensure_that_player_not_poses_as_sb_else(person, websocket)
+
+        if not self.game:
+            raise ValueError('The game has not started yet')
+
+        card = self.game.get_card(msg.card_id)
+        action = Action(card, msg.picked_color)
+        old_cards = list(self.game.get_persons_cards(person))
+        winner_ranking = self.game.play(person, action)
+        new_cards = self.game.get_persons_cards(person)
+
+        game_state_updated_msgs = self._broadcast_game_state_updated_msg()
+
+        if person.id in self.delta_subscribers:
+            player_cards_updated_msg = [
+                self._player_cards_delta_msg(websocket, person, old_cards,
+                                             new_cards)
+            ]
+        else:
+            player_cards_updated_msg = [MsgToSend(
+                websocket,
+                message='player cards updated',
+                player_cards=[self._card_to_dict(card) for card in new_cards],
+                legal_moves=self._get_legal_moves(person)
+            )]
+
+        game_won_msgs = []
+        legal_moves_msgs = []
+        if winner_ranking:
+            game_won_msgs = self._broadcast(
+                message='game won',
+                winner_name=winner_ranking[0].name,
+                sorted_list_of_player_places=[
+                    person.name for person in winner_ranking
+                ],
+                sorted_list_of_players_turtle_colors=[
+                    self.game._find_player(person).turtle.color
+                    for person in winner_ranking
+                ]
+            )
+            self._end_game()
+        else:
+            legal_moves_msgs = self._emit_legal_moves_to_active_player()
+
+        return game_state_updated_msgs + player_cards_updated_msg + \
+            legal_moves_msgs + game_won_msgs
+
+    def _end_game(self):
+        # people seated as bots leave together with the game, the
+        # controller forgets them with pop_departed
+        for id in self.bots:
+            self.people.pop(id, None)
+        self.departed |= self.bots
+        self.bots = set()
+        self.synthetic_bots = set()
+        self.players = {}
+        self.game = None
+        self.delta_subscribers = set()
+        self._game_state_cache = None
+        self._delta_base = None
+
+    def _player_cards_delta_msg(self, websocket, person, old_cards,
+                                new_cards):
+        return MsgToSend(
+            websocket,
+            message='player cards delta',
+            version=self._get_wire_version(),
+            removed_card_ids=[card.id for card in old_cards
+                              if card not in new_cards],
+            added_cards=[self._card_to_dict(card) for card in new_cards
+                         if card not in old_cards],
+            legal_moves=self._get_legal_moves(person)
+        )
+
+    def _emit_legal_moves_to_active_player(self):
+        person = self.game.active_player.person
+        if not person.is_connected():
+            return []
+        return [MsgToSend(
+            person.websocket,
+            message='legal moves',
+            player_cards=[self._card_to_dict(card)
+                          for card in self.game.get_persons_cards(person)],
+            legal_moves=self._get_legal_moves(person)
+        )]
+
+    def _broadcast_game_state_updated_msg(self):
+        state = self._get_game_state()
+        full_websockets, delta_websockets = self._split_by_protocol()
+
+        msgs = MsgToSend.broadcast(
+            full_websockets,
+            message='game state updated',
+            **state
+        )
+        if delta_websockets:
+            msgs += MsgToSend.broadcast(
+                delta_websockets,
+                **self._game_state_delta(state)
+            )
+
+        self._delta_base = (self.game, self._get_wire_version(), state)
+        return msgs
+
+    def _split_by_protocol(self):
+        full_websockets, delta_websockets = [], []
+        for person in self.people.values():
+            if not person.is_connected():
+                continue
+            if person.id in self.delta_subscribers:
+                delta_websockets.append(person.websocket)
+            else:
+                full_websockets.append(person.websocket)
+        return full_websockets, delta_websockets
+
+    def _game_state_delta(self, state):
+        version = self._get_wire_version()
+        if not self._delta_base or self._delta_base[0] is not self.game:
+            return dict(message='game state updated', version=version,
+                        **state)
+
+        _, base_version, base_state = self._delta_base
+        old_board, new_board = base_state['board'], state['board']
+        return dict(
+            message='game state delta',
+            base_version=base_version,
+            version=version,
+            board={
+                key: self._diff_stacks(old_board[key], new_board[key])
+                for key in new_board
+            },
+            number_of_start_stacks=len(
+                new_board['turtles_on_start_positions']),
+            active_player_idx=state['active_player_idx'],
+            recently_played_card=state['recently_played_card']
+        )
+
+    def _diff_stacks(self, old_stacks, new_stacks):
+        return [
+            [idx, stack] for idx, stack in enumerate(new_stacks)
+            if idx >= len(old_stacks) or old_stacks[idx] != stack
+        ]
+
+    def disconnected(self, websocket):
+        person = self._find_person_by_websocket(websocket)
+        del self.people_by_websocket[websocket]
+        if self.game:
+            person.websocket = None
+        else:
+            del self.people[person.id]
+            self.players.pop(person.id, None)
+
+    def clear_disconnected(self):
+        if self.game:
+            for person in self.players.values():
+                if person.is_connected():
+                    continue
+                if self.bot_takeover:
+                    person.websocket = BotConnection()
+                    self.bots.add(person.id)
+                else:
+                    self.game.remove_player(person)
+
+        self.people = {id: person for id, person in self.people.items()
+                       if person.is_connected()}
+        self.players = {id: person for id, person in self.players.items()
+                        if person.is_connected()}
+        if all(id in self.bots for id in self.players):
+            self._end_game()
+
+        if self.game:
+            return self._broadcast_game_state_updated_msg()
+
+        # TODO: obsłużyć informowanie użytkowników o rozłączeniu innych
+        # graczy i start gry od nowa
+
+    def pop_departed(self) -> set:
+        departed, self.departed = self.departed, set()
+        return departed
+
+    def get_bot_turn(self) -> BotTurn:
+        if not self.game:
+            return None
+        person = self.game.active_player.person
+        if person.id not in self.bots:
+            return None
+        return BotTurn(person.id, self.game, self.game.get_state_version())
+
+    def get_bot_search_state(self, turn: BotTurn) -> SearchState:
+        return get_search_state(turn.game, self.people[turn.person_id])
+
+    def play_bot_move(self, turn: BotTurn, card_id: int,
+                      picked_color: str) -> List[MsgToSend]:
+        # the game could have ended or moved on while the bot was searching
+        if self.game is not turn.game or turn.person_id not in self.bots or \
+                self.game.get_state_version() != turn.version:
+            return []
+        person = self.people[turn.person_id]
+        return self._handle_play_card(
+            PlayCardMsg(person.id, card_id, picked_color), person.websocket)
+
+    def _find_person_by_websocket(self, websocket):
+        if websocket not in self.people_by_websocket:
+            raise ValueError(
+                'There is no person corresponding to given websocket: ' +
+                f'{websocket}'
+            )
+        return self.people_by_websocket[websocket]
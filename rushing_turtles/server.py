@@ -2,20 +2,49 @@ import asyncio
 import websockets
 import logging
 
+from typing import List
+from concurrent.futures import Executor, ProcessPoolExecutor
+
 from rushing_turtles.game_controller import GameController
 from rushing_turtles.messages import MessageDeserializer, MsgToSend
+from rushing_turtles.outbound import OutboundQueue, DISCONNECT
+from rushing_turtles.room import BotTurn
+from rushing_turtles.bots.mcts import SearchState, search
 
 CLEAR_DISCONNECTED_PERIOD = 30
+SEND_TIMEOUT = 5
+OUTBOUND_QUEUE_SIZE = 64
+BOT_TIME_BUDGET = 1.0
+MAX_CONCURRENT_BOT_TURNS = 2
 
 
 class GameServer(object):
 
     def __init__(self, controller: GameController,
-                 deserializer: MessageDeserializer):
+                 deserializer: MessageDeserializer,
+                 concurrent_send: bool = True,
+                 send_timeout: float = SEND_TIMEOUT,
+                 outbound_queue_size: int = OUTBOUND_QUEUE_SIZE,
+                 overflow_policy: str = DISCONNECT,
+                 bot_time_budget: float = BOT_TIME_BUDGET,
+                 max_concurrent_bot_turns: int = MAX_CONCURRENT_BOT_TURNS,
+                 bot_executor: Executor = None):
         self.controller = controller
         self.deserializer = deserializer
+        self.concurrent_send = concurrent_send
+        self.send_timeout = send_timeout
+        self.outbound_queue_size = outbound_queue_size
+        self.overflow_policy = overflow_policy
+        self.outbound = {}
+        self.dropped_messages = 0
+        self.bot_time_budget = bot_time_budget
+        self.max_concurrent_bot_turns = max_concurrent_bot_turns
+        self.bot_executor = bot_executor
+        self._bot_semaphore = None
+        self._bot_turns = set()
 
-    async def serve(self, websocket, path):
+    async def serve(self, websocket, path=None):
+        self._open_outbound(websocket)
         try:
             async for message in websocket:
                 try:
@@ -26,6 +55,7 @@ class GameServer(object):
                     messages_to_send = self.controller.handle(
                         deserialized_message, websocket)
                     await self._send_messages(messages_to_send)
+                    self._schedule_bot_turns()
                 except ValueError as e:
                     logging.error(f'An error occured: {e}')
                     error_msg = MsgToSend(
@@ -34,26 +64,132 @@ class GameServer(object):
                         details=str(e),
                         offending_message=message
                     )
-                    await error_msg.send()
+                    await self._send_messages(error_msg)
         except Exception as e:
             logging.error(f'An exception occured: {e}')
         finally:
             messages_to_send = self.controller.disconnected(websocket)
             await self._send_messages(messages_to_send)
+            self._close_outbound(websocket)
+
+    def _open_outbound(self, websocket):
+        if self.outbound_queue_size:
+            self.outbound[websocket] = OutboundQueue(
+                websocket,
+                self.outbound_queue_size,
+                self.overflow_policy,
+                self.send_timeout
+            )
+
+    def _close_outbound(self, websocket):
+        queue = self.outbound.pop(websocket, None)
+        if queue:
+            queue.close()
+            self.dropped_messages += queue.dropped
+
+    def get_outbound_metrics(self):
+        depths = [queue.get_depth() for queue in self.outbound.values()]
+        return {
+            'connections': len(depths),
+            'queued_messages': sum(depths),
+            'max_queue_depth': max(depths, default=0),
+            'dropped_messages': self.dropped_messages + sum(
+                queue.dropped for queue in self.outbound.values())
+        }
 
     async def _send_messages(self, messages):
-        if messages:
-            if isinstance(messages, list):
-                for msg in messages:
-                    await msg.send()
+        if not messages:
+            return
+        if not isinstance(messages, list):
+            messages = [messages]
+
+        unqueued = []
+        for msg in messages:
+            queue = self.outbound.get(msg.websocket)
+            if queue:
+                await queue.put(msg)
             else:
-                await messages.send()
+                unqueued.append(msg)
+
+        if unqueued:
+            await self._send_directly(unqueued)
+
+    async def _send_directly(self, messages: List[MsgToSend]):
+        batches = self._group_by_websocket(messages)
+        if self.concurrent_send:
+            await asyncio.gather(*[self._send_batch(websocket, batch)
+                                   for websocket, batch in batches.items()])
+        else:
+            for websocket, batch in batches.items():
+                await self._send_batch(websocket, batch)
+
+    def _group_by_websocket(self, messages: List[MsgToSend]):
+        batches = {}
+        for msg in messages:
+            batches.setdefault(msg.websocket, []).append(msg)
+        return batches
+
+    async def _send_batch(self, websocket, batch: List[MsgToSend]):
+        try:
+            await asyncio.wait_for(self._send_in_order(batch),
+                                   self.send_timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f'Sending {len(batch)} message(s) to {websocket} '
+                            f'exceeded the deadline of {self.send_timeout}s')
+        except Exception as e:
+            logging.error(f'Could not send messages to {websocket}: {e}')
+
+    async def _send_in_order(self, batch: List[MsgToSend]):
+        for msg in batch:
+            await msg.send()
 
     async def clear_disconnected(self):
         while True:
             await asyncio.sleep(CLEAR_DISCONNECTED_PERIOD)
             logging.info('Clearing disconnected players')
             await self._send_messages(self.controller.clear_disconnected())
+            self._schedule_bot_turns()
+
+    def _schedule_bot_turns(self):
+        for room_id, turn in self.controller.get_bot_turns():
+            key = (room_id, turn.game, turn.version)
+            if key not in self._bot_turns:
+                self._bot_turns.add(key)
+                state = self.controller.get_bot_search_state(room_id, turn)
+                asyncio.ensure_future(
+                    self._play_bot_turn(room_id, turn, state, key))
+
+    async def _play_bot_turn(self, room_id, turn: BotTurn,
+                             state: SearchState, key):
+        # searches run in worker processes, so the loop keeps serving
+        # players; the semaphore limits how many of them run at once
+        try:
+            async with self._get_bot_semaphore():
+                card_id, picked_color = \
+                    await asyncio.get_event_loop().run_in_executor(
+                        self._get_bot_executor(), search, state,
+                        self.bot_time_budget)
+            messages = self.controller.play_bot_move(
+                room_id, turn, card_id, picked_color)
+            await self._send_messages(messages)
+        except Exception as e:
+            logging.error(f'Bot could not play in room {room_id}: {e}')
+            return
+        finally:
+            self._bot_turns.discard(key)
+        self._schedule_bot_turns()
+
+    def _get_bot_semaphore(self):
+        if not self._bot_semaphore:
+            self._bot_semaphore = asyncio.Semaphore(
+                self.max_concurrent_bot_turns)
+        return self._bot_semaphore
+
+    def _get_bot_executor(self):
+        if not self.bot_executor:
+            self.bot_executor = ProcessPoolExecutor(
+                self.max_concurrent_bot_turns)
+        return self.bot_executor
 
 
 if __name__ == '__main__':
@@ -66,7 +202,7 @@ if __name__ == '__main__':
 
     logging.info(f'Starting server... Address: {addr}, port: {port}')
 
-    controller = GameController()
+    controller = GameController(bot_takeover=True)
     deserializer = MessageDeserializer()
     server = GameServer(controller, deserializer)
 
@@ -0,0 +1,176 @@
+import argparse
+import random
+import multiprocessing
+
+from typing import List, Iterator
+from collections import Counter, namedtuple
+
+from rushing_turtles.model.game import Game, create_game
+from rushing_turtles.model.player import Player
+from rushing_turtles.model.action import Action
+from rushing_turtles.model.person import Person
+from rushing_turtles.bots.mcts import MCTSBot
+
+MAX_TURNS = 1000
+GAMES_PER_CHUNK = 100
+
+GameResult = namedtuple('GameResult', 'winner_seat, turns, reshuffles')
+
+
+class RandomPolicy(object):
+
+    def choose_action(self, game: Game, player: Player,
+                      rng: random.Random) -> Action:
+        return rng.choice(game.get_legal_actions(player.person))
+
+
+class GreedyPolicy(object):
+
+    def choose_action(self, game: Game, player: Player,
+                      rng: random.Random) -> Action:
+        return max(game.get_legal_actions(player.person),
+                   key=lambda action: self._score(player, action))
+
+    def _score(self, player: Player, action: Action):
+        if action.color_id == player.turtle.color_id:
+            return action.get_offset()
+        return -action.get_offset()
+
+
+POLICIES = {'random': RandomPolicy, 'greedy': GreedyPolicy, 'mcts': MCTSBot}
+
+
+def play_game(policies: list, rng: random.Random,
+              max_turns: int = MAX_TURNS) -> GameResult:
+    people = [Person(seat, f'Player {seat}') for seat in range(len(policies))]
+    game = create_game(people, seed=rng.getrandbits(64))
+
+    for turn in range(1, max_turns + 1):
+        player = game.active_player
+        policy = policies[player.person.id]
+        ranking = game.play(player.person,
+                            policy.choose_action(game, player, rng))
+        if ranking:
+            return GameResult(ranking[0].id, turn, game.stacks.reshuffles)
+
+    return GameResult(None, max_turns, game.stacks.reshuffles)
+
+
+class SimulationStats(object):
+    games: int
+    unfinished: int
+    wins_by_seat: List[int]
+    turns: Counter
+    reshuffles: int
+
+    def __init__(self, number_of_seats: int):
+        self.games = 0
+        self.unfinished = 0
+        self.wins_by_seat = [0] * number_of_seats
+        self.turns = Counter()
+        self.reshuffles = 0
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        if result.winner_seat is None:
+            self.unfinished += 1
+        else:
+            self.wins_by_seat[result.winner_seat] += 1
+        self.turns[result.turns] += 1
+        self.reshuffles += result.reshuffles
+
+    def merge(self, other: 'SimulationStats') -> None:
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.wins_by_seat = [wins + other_wins for wins, other_wins
+                             in zip(self.wins_by_seat, other.wins_by_seat)]
+        self.turns.update(other.turns)
+        self.reshuffles += other.reshuffles
+
+    def get_win_rates(self) -> List[float]:
+        if not self.games:
+            return [0.0] * len(self.wins_by_seat)
+        return [wins / self.games for wins in self.wins_by_seat]
+
+    def get_mean_turns(self) -> float:
+        if not self.games:
+            return 0.0
+        return sum(turns * cnt for turns, cnt in self.turns.items()) / \
+            self.games
+
+    def get_mean_reshuffles(self) -> float:
+        if not self.games:
+            return 0.0
+        return self.reshuffles / self.games
+
+    def to_dict(self) -> dict:
+        return {
+            'games': self.games,
+            'unfinished': self.unfinished,
+            'win_rate_by_seat': self.get_win_rates(),
+            'mean_turns': self.get_mean_turns(),
+            'min_turns': min(self.turns, default=0),
+            'max_turns': max(self.turns, default=0),
+            'mean_reshuffles': self.get_mean_reshuffles()
+        }
+
+
+def _play_chunk(task) -> SimulationStats:
+    policies, seed, games, max_turns = task
+    # every task has its own seed, so results do not depend on how tasks
+    # are distributed among the workers
+    rng = random.Random(seed)
+
+    stats = SimulationStats(len(policies))
+    for _ in range(games):
+        stats.add(play_game(policies, rng, max_turns))
+    return stats
+
+
+def _create_tasks(policies: list, games: int, seed: int, max_turns: int,
+                  chunk_size: int):
+    for chunk_idx, first_game in enumerate(range(0, games, chunk_size)):
+        yield (policies, seed + chunk_idx,
+               min(chunk_size, games - first_game), max_turns)
+
+
+def iter_simulation(policies: list, games: int, seed: int = 0,
+                    processes: int = None, max_turns: int = MAX_TURNS,
+                    chunk_size: int = GAMES_PER_CHUNK) \
+        -> Iterator[SimulationStats]:
+    tasks = _create_tasks(policies, games, seed, max_turns, chunk_size)
+    stats = SimulationStats(len(policies))
+
+    if processes == 1:
+        for task in tasks:
+            stats.merge(_play_chunk(task))
+            yield stats
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for chunk_stats in pool.imap_unordered(_play_chunk, tasks):
+            stats.merge(chunk_stats)
+            yield stats
+
+
+def simulate(policies: list, games: int, **kwargs) -> SimulationStats:
+    stats = SimulationStats(len(policies))
+    for stats in iter_simulation(policies, games, **kwargs):
+        pass
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Play many headless games and print statistics')
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--policy', choices=POLICIES, default='random')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args()
+
+    policies = [POLICIES[args.policy]() for _ in range(args.players)]
+    for stats in iter_simulation(policies, args.games, seed=args.seed,
+                                 processes=args.processes):
+        print(stats.to_dict())
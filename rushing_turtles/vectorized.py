@@ -0,0 +1,148 @@
+import numpy as np
+
+from rushing_turtles.model.board import Board, NUMBER_OF_FIELDS
+from rushing_turtles.model.game import CARDS
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+MAX_TURNS = 1000
+
+# Deck composition as parallel arrays, rainbow cards have color -1
+CARD_COLORS = np.array([card.color_id if not card.is_rainbow() else -1
+                        for card in CARDS])
+CARD_OFFSETS = np.array([card.offset for card in CARDS])
+CARD_ARROWS = np.array([card.is_arrow() for card in CARDS])
+
+
+class BoardBatch(object):
+    size: int
+    positions: np.ndarray
+    heights: np.ndarray
+    start_stacks: np.ndarray
+    next_start_stack: np.ndarray
+
+    def __init__(self, size: int, number_of_fields: int = NUMBER_OF_FIELDS):
+        # turtles are indexed in the order of COLORS; start_stacks holds
+        # an increasing id of the start field stack (-1 outside of it)
+        turtles = len(COLORS)
+        self.size = size
+        self.number_of_fields = number_of_fields
+        self.positions = np.zeros((size, turtles), dtype=np.int16)
+        self.heights = np.zeros((size, turtles), dtype=np.int16)
+        self.start_stacks = np.tile(np.arange(turtles, dtype=np.int32),
+                                    (size, 1))
+        self.next_start_stack = np.full(size, turtles, dtype=np.int32)
+        self._boards = np.arange(size)
+
+    def move(self, turtles: np.ndarray, offsets: np.ndarray,
+             active: np.ndarray = None) -> None:
+        if active is None:
+            active = np.ones(self.size, dtype=bool)
+
+        pos = self.positions[self._boards, turtles]
+        height = self.heights[self._boards, turtles]
+        start_stack = self.start_stacks[self._boards, turtles]
+
+        if np.any(active & (pos == 0) & (offsets < 0)):
+            raise ValueError(
+                "Turtle can't move backward when it is in the start field")
+
+        offsets = np.minimum(offsets, self.number_of_fields - 1 - pos)
+        from_start_pos = (offsets - 1) % (self.number_of_fields - 1) + 1
+        new_pos = np.where(pos == 0, from_start_pos,
+                           np.maximum(pos + offsets, 0))
+
+        same_place = (self.positions == pos[:, None]) & \
+            ((pos[:, None] > 0) | (self.start_stacks == start_stack[:, None]))
+        moved = same_place & (self.heights >= height[:, None]) & \
+            active[:, None]
+        at_destination = (self.positions == new_pos[:, None]) & ~moved & \
+            (new_pos[:, None] > 0)
+        base_height = at_destination.sum(axis=1)
+
+        self.heights = np.where(
+            moved, base_height[:, None] + self.heights - height[:, None],
+            self.heights).astype(np.int16)
+        self.positions = np.where(moved, new_pos[:, None],
+                                  self.positions).astype(np.int16)
+
+        to_start = active & (new_pos == 0)
+        self.start_stacks = np.where(
+            moved, np.where(to_start, self.next_start_stack, -1)[:, None],
+            self.start_stacks).astype(np.int32)
+        self.next_start_stack += to_start
+
+    def get_last_mask(self) -> np.ndarray:
+        return self.positions == self.positions.min(axis=1, keepdims=True)
+
+    def has_anyone_finished(self) -> np.ndarray:
+        return (self.positions == self.number_of_fields - 1).any(axis=1)
+
+    def get_ranking(self) -> np.ndarray:
+        turtles = len(COLORS)
+        color_order = np.argsort(np.argsort(COLORS))
+        keys = (self.positions.astype(np.int64) * turtles +
+                self.heights) * turtles + color_order
+        return np.argsort(-keys, axis=1, kind='stable')
+
+    def to_board(self, idx: int) -> Board:
+        turtles = [Turtle(color) for color in COLORS]
+        board = Board(turtles, self.number_of_fields)
+        start_stacks = {}
+
+        order = np.argsort(-self.heights[idx], kind='stable')
+        for turtle_idx in order:
+            pos = self.positions[idx, turtle_idx]
+            if pos > 0:
+                stack = board.further_fields[pos - 1]
+            else:
+                stack = start_stacks.setdefault(
+                    self.start_stacks[idx, turtle_idx], [])
+            stack.append(turtles[turtle_idx])
+
+        board.start_field = [start_stacks[stack_id]
+                             for stack_id in sorted(start_stacks)]
+        board._rebuild_indexes()
+        return board
+
+
+def simulate_random_games(size: int, number_of_players: int,
+                          rng: np.random.Generator,
+                          max_turns: int = MAX_TURNS):
+    # Every turn the active player plays a card drawn from the deck
+    # composition with replacement; a drawn card that can't be played is
+    # redrawn on the next step, like Game does with a hand without moves.
+    boards = BoardBatch(size)
+    turtles = len(COLORS)
+    seat_turtles = np.argsort(rng.random((size, turtles)),
+                              axis=1)[:, :number_of_players]
+    finished = np.zeros(size, dtype=bool)
+    turns = np.zeros(size, dtype=np.int32)
+    all_boards = np.arange(size)
+
+    for _ in range(max_turns):
+        if finished.all():
+            break
+
+        cards = rng.integers(len(CARDS), size=size)
+        colors, offsets = CARD_COLORS[cards], CARD_OFFSETS[cards]
+        arrows = CARD_ARROWS[cards]
+
+        eligible = (~arrows[:, None] | boards.get_last_mask()) & \
+            ((offsets[:, None] > 0) | (boards.positions > 0))
+        scores = np.where(eligible, rng.random((size, turtles)), -1)
+        rainbow_turtles = scores.argmax(axis=1)
+
+        rainbow = colors < 0
+        picked = np.where(rainbow, rainbow_turtles, colors)
+        legal = np.where(rainbow, eligible.any(axis=1),
+                         (offsets > 0) |
+                         (boards.positions[all_boards, picked] > 0))
+
+        active = ~finished & legal
+        boards.move(picked, offsets, active)
+        turns += active
+        finished |= boards.has_anyone_finished()
+
+    ranks = np.argsort(boards.get_ranking(), axis=1)
+    winners = ranks[all_boards[:, None], seat_turtles].argmin(axis=1)
+    return np.where(finished, winners, -1), turns
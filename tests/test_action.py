@@ -57,3 +57,14 @@ def test_does_move_last_turtle_should_return_false_when_card_symbol_is_plus():
     actual = action.does_move_last_turtle()
 
     assert not actual
+
+
+def test_init_should_raise_when_picked_color_is_unknown():
+    with pytest.raises(ValueError):
+        Action(Card(0, 'RAINBOW', 'PLUS'), 'ORANGE')
+
+
+def test_color_should_be_none_when_card_is_not_rainbow():
+    action = Action(Card(0, 'RED', 'PLUS'))
+
+    assert action.color is None
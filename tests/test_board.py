@@ -1,7 +1,9 @@
 import pytest
+import random
 
 from rushing_turtles.model.board import Board
-from rushing_turtles.model.turtle import Turtle
+from rushing_turtles.model.turtle import Turtle, COLORS
+from rushing_turtles.model.game import CARDS
 from rushing_turtles.model.card import Card
 
 
@@ -566,3 +568,307 @@ def test_get_ranking_returns_turtles_sorted_by_position_when_stack_on_start():
 
     assert actual == [turtles[4], turtles[1], turtles[3], turtles[0],
                       turtles[2]]
+
+
+def test_version_should_be_zero_after_init():
+    board = Board([Turtle('RED')])
+
+    assert board.version == 0
+
+
+def test_version_should_increase_after_each_move():
+    turtle = Turtle('RED')
+    board = Board([turtle])
+
+    board.move(turtle, 1)
+    board.move(turtle, 1)
+
+    assert board.version == 2
+
+
+def test_positions_should_match_stacks_after_random_moves():
+    rng = random.Random(0)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+
+    for _ in range(500):
+        turtle = rng.choice(turtles)
+        offset = rng.choice([1, 2, -1])
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+        if board.has_anyone_finished():
+            board = Board(turtles)
+
+        assert board.positions == scan_positions(board)
+
+
+def test_undo_move_should_restore_board_after_random_moves():
+    rng = random.Random(1)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    snapshots = []
+    undos = []
+
+    for _ in range(200):
+        turtle = rng.choice(turtles)
+        offset = rng.choice([1, 2, -1, -2])
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        if board.has_anyone_finished():
+            break
+        snapshots.append(snapshot(board))
+        undos.append(board.apply_move(turtle, offset))
+
+    while undos:
+        board.undo_move(undos.pop())
+        assert snapshot(board) == snapshots.pop()
+
+    assert board.positions == scan_positions(board)
+
+
+def test_undo_move_should_restore_emptied_start_stack_at_its_index():
+    turtles = [Turtle('RED'), Turtle('GREEN'), Turtle('BLUE')]
+    board = Board(turtles)
+
+    undo = board.apply_move(turtles[1], 1)
+    board.undo_move(undo)
+
+    assert board.start_field == [[turtle] for turtle in turtles]
+    assert board.further_fields == [[] for _ in range(9)]
+
+
+def test_undo_move_should_remove_stack_created_in_start_field():
+    red, green = Turtle('RED'), Turtle('GREEN')
+    board = Board([red, green])
+    board.move(red, 1)
+    board.move(green, 1)
+
+    undo = board.apply_move(green, -1)
+    board.undo_move(undo)
+
+    assert board.start_field == []
+    assert board.further_fields[0] == [green, red]
+    assert board.positions == {red: (1, 0), green: (1, 1)}
+
+
+def test_undo_move_should_increase_version():
+    turtle = Turtle('RED')
+    board = Board([turtle])
+
+    board.undo_move(board.apply_move(turtle, 1))
+
+    assert board.version == 2
+
+
+def test_hash_should_match_recomputed_hash_after_random_moves():
+    rng = random.Random(2)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+
+    for _ in range(500):
+        turtle = rng.choice(turtles)
+        offset = rng.choice([1, 2, -1])
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+        if board.has_anyone_finished():
+            board = Board(turtles)
+
+        assert board.hash == board._compute_hash()
+
+
+def test_hash_should_be_equal_for_same_configuration_reached_differently():
+    red, green = Turtle('RED'), Turtle('GREEN')
+    board = Board([red, green])
+    other = Board([red, green])
+
+    board.move(red, 1)
+    board.move(green, 2)
+    other.move(green, 1)
+    other.move(green, 1)
+    other.move(red, 1)
+
+    assert board.hash == other.hash
+
+
+def test_hash_should_differ_when_stack_order_differs():
+    red, green = Turtle('RED'), Turtle('GREEN')
+    board = Board([red, green])
+    other = Board([red, green])
+
+    board.move(red, 1)
+    board.move(green, 1)
+    other.move(green, 1)
+    other.move(red, 1)
+
+    assert board.hash != other.hash
+
+
+def test_undo_move_should_restore_hash():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    board.move(turtles[0], 1)
+    initial_hash = board.hash
+
+    board.undo_move(board.apply_move(turtles[1], 1))
+
+    assert board.hash == initial_hash
+
+
+def test_card_playability_should_match_board_after_random_moves():
+    rng = random.Random(3)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles[:3])
+
+    for _ in range(300):
+        turtle = rng.choice(turtles[:3])
+        offset = rng.choice([1, 2, -1, -2])
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+        if board.has_anyone_finished():
+            board = Board(turtles[:3])
+
+        for card in CARDS:
+            assert board.is_move_with_card_possible(card) == \
+                is_move_possible_by_scan(board, card)
+
+
+def test_is_move_with_any_card_possible_returns_false_for_unplayable_hand():
+    board = Board([Turtle('RED')])
+    hand = [Card(0, 'RED', 'MINUS'), Card(1, 'GREEN', 'PLUS'),
+            Card(2, 'RAINBOW', 'MINUS')]
+
+    assert not board.is_move_with_any_card_possible(hand)
+    assert board.is_move_with_any_card_possible(
+        hand + [Card(3, 'RAINBOW', 'ARROW')])
+
+
+def is_move_possible_by_scan(board, card):
+    off_start = [turtle for turtle, (pos, _) in board.positions.items()
+                 if pos > 0]
+    if card.is_rainbow():
+        return bool(board.turtles) and (card.offset > 0 or bool(off_start))
+    turtle = Turtle(card.color)
+    return turtle in board.turtles and \
+        (card.offset > 0 or turtle in off_start)
+
+
+def test_ranking_should_match_sorted_turtles_after_random_moves_and_undos():
+    rng = random.Random(4)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    undos = []
+
+    for _ in range(1000):
+        if undos and rng.random() < 0.3:
+            board.undo_move(undos.pop())
+        else:
+            turtle = rng.choice(turtles)
+            offset = rng.choice([1, 2, -1, -2])
+            if offset < 0 and board._find_pos(turtle) == 0:
+                continue
+            undos.append(board.apply_move(turtle, offset))
+        if board.has_anyone_finished():
+            board = Board(turtles)
+            undos = []
+
+        assert board.get_ranking() == sort_by_position(board)
+        assert [board.is_last(turtle) for turtle in turtles] == \
+            [board.positions[turtle][0] == min(
+                pos for pos, _ in board.positions.values())
+             for turtle in turtles]
+
+
+def sort_by_position(board):
+    # positions are scanned from the stacks, not read from board.positions
+    positions = scan_positions(board)
+    return sorted(
+        board.turtles,
+        key=lambda x: (*positions[x], x.color),
+        reverse=True
+    )
+
+
+def test_board_should_have_configured_number_of_fields():
+    board = Board([Turtle('RED')], 100)
+
+    assert len(board.further_fields) == 99
+
+
+def test_init_should_raise_when_board_has_less_than_two_fields():
+    with pytest.raises(ValueError):
+        Board([Turtle('RED')], 1)
+
+
+def test_move_should_clip_offset_to_last_of_configured_fields():
+    turtle = Turtle('RED')
+    board = Board([turtle], 100)
+    board.move(turtle, 1)
+
+    for _ in range(60):
+        board.move(turtle, 2)
+
+    assert board.positions[turtle] == (99, 0)
+    assert board.has_anyone_finished()
+
+
+def test_clone_should_not_change_when_original_moves():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    board.move(turtles[0], 2)
+    clone = board.clone()
+    expected = snapshot(clone)
+
+    board.move(turtles[1], 2)
+    board.move(turtles[0], -1)
+
+    assert snapshot(clone) == expected
+    assert clone.get_ranking() == sort_by_position(clone)
+
+
+def test_original_should_not_change_when_clone_moves():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    board.move(turtles[0], 2)
+    expected = snapshot(board)
+    expected_hash = board.hash
+    clone = board.clone()
+
+    undo = clone.apply_move(turtles[1], 2)
+    clone.move(turtles[0], 1)
+
+    assert snapshot(board) == expected
+    assert board.hash == expected_hash
+    assert clone.positions[turtles[1]] == (3, 1)
+    assert undo.to_pos == 2
+
+
+def test_clone_should_undo_moves_made_before_cloning():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    undo = board.apply_move(turtles[2], 3)
+    clone = board.clone()
+
+    clone.undo_move(undo)
+
+    assert snapshot(clone) == snapshot(Board(turtles))
+    assert board.positions[turtles[2]] == (3, 0)
+
+
+def snapshot(board):
+    return ([list(stack) for stack in board.start_field],
+            [list(stack) for stack in board.further_fields],
+            dict(board.positions))
+
+
+def scan_positions(board):
+    positions = {}
+    for stack in board.start_field:
+        for idx, turtle in enumerate(stack):
+            positions[turtle] = (0, len(stack) - 1 - idx)
+    for field_idx, stack in enumerate(board.further_fields):
+        for idx, turtle in enumerate(stack):
+            positions[turtle] = (field_idx + 1, len(stack) - 1 - idx)
+    return positions
@@ -1,6 +1,6 @@
 import pytest
 
-from rushing_turtles.model.card import Card
+from rushing_turtles.model.card import Card, CardCatalog
 
 
 def test_should_raise_when_color_is_not_valid():
@@ -51,3 +51,29 @@ def test_is_rainbow_should_return_false_for_regular_card():
     card = Card(0, 'RED', 'PLUS')
 
     assert card.is_rainbow() is False
+
+
+def test_catalog_should_return_card_by_id():
+    cards = [Card(3, 'RED', 'PLUS'), Card(7, 'RAINBOW', 'ARROW')]
+    catalog = CardCatalog(cards)
+
+    assert catalog.get_card(7) is cards[1]
+    assert catalog.get_index(7) == 1
+
+
+def test_catalog_should_raise_when_card_does_not_exist():
+    catalog = CardCatalog([Card(3, 'RED', 'PLUS')])
+
+    with pytest.raises(ValueError):
+        catalog.get_card(4)
+
+
+def test_color_and_symbol_should_be_translated_back_to_strings():
+    card = Card(0, 'RAINBOW', 'ARROW_ARROW')
+
+    assert (card.color, card.symbol) == ('RAINBOW', 'ARROW_ARROW')
+
+
+def test_is_arrow_should_return_true_only_for_arrow_symbols():
+    assert Card(0, 'RAINBOW', 'ARROW').is_arrow()
+    assert not Card(0, 'RAINBOW', 'MINUS').is_arrow()
@@ -89,3 +89,50 @@ def test_get_new_cards_should_return_cards():
     actual = stacks.get_new_cards(2)
 
     assert actual == [card1, card2]
+
+
+def test_reshuffles_should_count_reshuffles_of_played_cards():
+    cards = [Card(0, 'RED', 'PLUS'), Card(1, 'GREEN', 'MINUS')]
+    stacks = CardStacks(cards)
+
+    for _ in range(5):
+        stacks.put(stacks.get_new())
+
+    assert stacks.reshuffles == 3
+
+
+def test_played_cards_should_start_with_most_recent_card():
+    cards = [Card(0, 'RED', 'PLUS'), Card(1, 'GREEN', 'MINUS')]
+    stacks = CardStacks(cards)
+
+    for _ in range(2):
+        stacks.put(stacks.get_new())
+
+    assert stacks.played_cards == cards[::-1]
+    assert stacks.available_cards == []
+
+
+def test_clone_should_not_change_when_original_puts_cards():
+    cards = [Card(idx, 'RED', 'PLUS') for idx in range(4)]
+    stacks = CardStacks(cards)
+    stacks.put(stacks.get_new())
+    clone = stacks.clone()
+
+    stacks.put(stacks.get_new())
+
+    assert clone.played_cards == cards[:1]
+    assert clone.available_cards == cards[1:]
+
+
+def test_clone_should_reshuffle_like_original_without_consuming_its_rng():
+    cards = [Card(idx, 'RED', 'PLUS') for idx in range(10)]
+    stacks = CardStacks(cards, random.Random(3))
+    for _ in range(10):
+        stacks.put(stacks.get_new())
+    clone = stacks.clone()
+
+    drawn_by_clone = [clone.get_new() for _ in range(5)]
+    drawn_by_original = [stacks.get_new() for _ in range(5)]
+
+    assert drawn_by_clone == drawn_by_original
+    assert clone.reshuffles == stacks.reshuffles == 1
@@ -0,0 +1,86 @@
+import random
+
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.compact_board import CompactBoard
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+
+def test_board_should_be_restored_after_init():
+    board = Board([Turtle('RED'), Turtle('GREEN')])
+
+    actual = CompactBoard.from_board(board).to_board()
+
+    assert_same_boards(actual, board)
+
+
+def test_board_with_stacks_should_be_restored():
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+    board.move(turtles[0], 1)
+    board.move(turtles[1], 1)
+    board.move(turtles[0], -1)
+    board.move(turtles[2], 3)
+
+    actual = CompactBoard.from_board(board).to_board()
+
+    assert_same_boards(actual, board)
+
+
+def test_boards_should_be_restored_after_random_moves():
+    rng = random.Random(0)
+    turtles = [Turtle(color) for color in COLORS]
+    board = Board(turtles)
+
+    for _ in range(300):
+        turtle = rng.choice(turtles)
+        offset = rng.choice([1, 2, -1])
+        if offset < 0 and board._find_pos(turtle) == 0:
+            continue
+        board.move(turtle, offset)
+
+        assert_same_boards(CompactBoard.from_board(board).to_board(), board)
+
+
+def test_equal_boards_should_have_equal_compact_boards():
+    first = Board([Turtle('RED'), Turtle('GREEN')])
+    second = Board([Turtle('RED'), Turtle('GREEN')])
+    first.move(Turtle('RED'), 2)
+    second.move(Turtle('RED'), 1)
+    second.move(Turtle('RED'), 1)
+
+    assert CompactBoard.from_board(first) == CompactBoard.from_board(second)
+    assert hash(CompactBoard.from_board(first)) == \
+        hash(CompactBoard.from_board(second))
+
+
+def test_different_boards_should_have_different_compact_boards():
+    first = Board([Turtle('RED'), Turtle('GREEN')])
+    second = Board([Turtle('RED'), Turtle('GREEN')])
+    first.move(Turtle('RED'), 2)
+
+    assert CompactBoard.from_board(first) != CompactBoard.from_board(second)
+
+
+def test_copy_should_be_equal_to_original():
+    compact = CompactBoard.from_board(Board([Turtle('RED')]))
+
+    assert compact.copy() == compact
+
+
+def test_board_with_many_fields_should_be_restored():
+    red, blue = Turtle('RED'), Turtle('BLUE')
+    board = Board([red, blue], 300)
+    board.move(red, 2)
+    for _ in range(100):
+        board.move(blue, 2)
+
+    actual = CompactBoard.from_board(board).to_board()
+
+    assert actual.number_of_fields == 300
+    assert_same_boards(actual, board)
+
+
+def assert_same_boards(actual, expected):
+    assert actual.start_field == expected.start_field
+    assert actual.further_fields == expected.further_fields
+    assert actual.positions == expected.positions
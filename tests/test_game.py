@@ -2,6 +2,7 @@ import random
 import pytest
 
 from rushing_turtles.model.game import Game, HAND_SIZE, create_game
+from rushing_turtles.model.game import replay_game
 from rushing_turtles.model.turtle import Turtle
 from rushing_turtles.model.card import Card
 from rushing_turtles.model.person import Person
@@ -344,6 +345,30 @@ def test_it_should_be_third_player_turn_after_removing_second_player(cards):
     assert game.active_player.person == people[2]
 
 
+def test_state_version_should_change_after_play(game, people):
+    before = game.get_state_version()
+
+    game.play(people[0], Action(Card(0, 'RED', 'PLUS')))
+
+    assert game.get_state_version() > before
+
+
+def test_state_version_should_change_after_removing_player(game, people):
+    before = game.get_state_version()
+
+    game.remove_player(people[1])
+
+    assert game.get_state_version() > before
+
+
+def test_state_version_should_change_when_board_changes(game):
+    before = game.get_state_version()
+
+    game.board.move(Turtle('RED'), 1)
+
+    assert game.get_state_version() > before
+
+
 def test_create_game_should_create_game(people):
     game = create_game(people)
 
@@ -352,6 +377,212 @@ def test_create_game_should_create_game(people):
     assert len(game.stacks.available_cards) == 42
 
 
+def test_games_should_share_card_objects_from_catalog(people):
+    game = create_game(people)
+    other = create_game(people)
+
+    card = game.players[0].cards[0]
+    assert game.get_card(card.id) is other.get_card(card.id)
+
+
+def test_get_card_should_raise_when_card_does_not_exist(people):
+    game = create_game(people)
+
+    with pytest.raises(ValueError):
+        game.get_card(len(game.cards))
+
+
+def test_create_game_with_seed_should_not_depend_on_global_random(people):
+    game = create_game(people, seed=7)
+    random.seed(1)
+    other = create_game(people, seed=7)
+
+    assert game.seed == 7
+    assert [p.cards for p in game.players] == \
+        [p.cards for p in other.players]
+    assert [p.turtle for p in game.players] == \
+        [p.turtle for p in other.players]
+
+
+def test_create_game_with_seed_should_not_consume_global_random(people):
+    state = random.getstate()
+
+    create_game(people, seed=7)
+
+    assert random.getstate() == state
+
+
+def test_replay_game_should_restore_game_from_seed_and_history(people):
+    game = create_game(people, seed=3)
+    rng = random.Random(3)
+    for _ in range(100):
+        player = game.active_player
+        if game.play(player.person,
+                     rng.choice(game.get_legal_actions(player.person))):
+            break
+
+    replayed = replay_game(people, 3, game.history)
+
+    assert replayed.board.positions == game.board.positions
+    assert replayed.active_player.person == game.active_player.person
+    assert [p.cards for p in replayed.players] == \
+        [p.cards for p in game.players]
+    assert list(replayed.stacks.available_cards) == \
+        list(game.stacks.available_cards)
+
+
+def test_game_without_seed_should_be_replayable_from_recorded_seed(people):
+    game = create_game(people)
+    rng = random.Random(1)
+    for _ in range(10):
+        player = game.active_player
+        if game.play(player.person,
+                     rng.choice(game.get_legal_actions(player.person))):
+            break
+
+    replayed = replay_game(people, game.seed, game.history)
+
+    assert game.seed is not None
+    assert replayed.board.positions == game.board.positions
+    assert [p.cards for p in replayed.players] == \
+        [p.cards for p in game.players]
+
+
+def test_remove_player_should_be_recorded_in_history(people):
+    game = create_game(people + [Person(2, 'Olek')], seed=3)
+
+    game.remove_player(people[1])
+
+    assert game.history[-1].person_id == 1
+    assert game.history[-1].card_id is None
+
+
+def test_model_objects_should_not_have_instance_dict(people):
+    game = create_game(people)
+    player = game.players[0]
+    card = player.cards[0]
+    action = Action(card, 'RED' if card.is_rainbow() else None)
+
+    for obj in [game, game.board, game.stacks, game.cards, player,
+                player.person, player.turtle, card, action]:
+        assert not hasattr(obj, '__dict__')
+
+
+def test_create_game_should_use_configured_fields_and_colors(people):
+    game = create_game(people, number_of_fields=50, colors=['RED', 'BLUE'])
+
+    assert game.board.number_of_fields == 50
+    assert sorted(turtle.color for turtle in game.turtles) == ['BLUE', 'RED']
+    assert {card.color for card in game.cards} == {'RED', 'BLUE', 'RAINBOW'}
+
+
+def test_game_should_fail_when_there_are_less_turtles_than_players(people):
+    with pytest.raises(ValueError):
+        create_game(people + [Person(2, 'Olek')], colors=['RED', 'BLUE'])
+
+
+def test_replay_game_should_restore_game_with_custom_config(people):
+    config = {'number_of_fields': 30, 'colors': ['RED', 'BLUE', 'GREEN']}
+    game = create_game(people, seed=5, **config)
+    rng = random.Random(5)
+    for _ in range(10):
+        player = game.active_player
+        game.play(player.person,
+                  rng.choice(game.get_legal_actions(player.person)))
+
+    replayed = replay_game(people, 5, game.history, **config)
+
+    assert replayed.board.positions == game.board.positions
+
+
+def test_get_legal_actions_should_list_actions_that_can_be_played(people):
+    game = create_game(people, seed=11)
+    rng = random.Random(11)
+    for _ in range(20):
+        player = game.active_player
+        game.play(player.person,
+                  rng.choice(game.get_legal_actions(player.person)))
+    person = game.active_player.person
+
+    legal = {(action.card.id, action.color)
+             for action in game.get_legal_actions(person)}
+
+    for card in game.get_persons_cards(person):
+        colors = [turtle.color for turtle in game.turtles] \
+            if card.is_rainbow() else [None]
+        for color in colors:
+            replayed = replay_game(people, 11, game.history)
+            try:
+                replayed.play(person, Action(card, color))
+                assert (card.id, color) in legal
+            except ValueError:
+                assert (card.id, color) not in legal
+
+
+def test_get_legal_actions_should_limit_arrow_cards_to_last_turtles(people):
+    game = create_game(people, seed=2)
+    player = game.players[0]
+    game.board.move(game.turtles[0], 1)
+    player.cards = [card for card in game.cards
+                    if card.is_arrow() and card.is_rainbow()]
+
+    actions = game.get_legal_actions(player.person)
+
+    assert {action.color for action in actions} == \
+        {turtle.color for turtle in game.turtles[1:]}
+
+
+def play_random_moves(game, moves, rng):
+    for _ in range(moves):
+        person = game.active_player.person
+        if game.play(person, rng.choice(game.get_legal_actions(person))):
+            return
+
+
+def get_state(game):
+    return (dict(game.board.positions), game.board.hash,
+            [list(player.cards) for player in game.players],
+            game.active_player.person, game.stacks.available_cards,
+            game.stacks.played_cards, list(game.history), game.version)
+
+
+def test_clone_should_share_immutable_parts(people):
+    game = create_game(people, seed=4)
+
+    clone = game.clone()
+
+    assert clone.cards is game.cards
+    assert clone.turtles is game.turtles
+    assert [p.person for p in clone.players] == \
+        [p.person for p in game.players]
+    assert clone.players[0].person is game.players[0].person
+    assert clone.active_player is clone.players[0]
+
+
+def test_clone_should_not_change_when_original_is_played(people):
+    game = create_game(people, seed=4)
+    play_random_moves(game, 5, random.Random(4))
+    clone = game.clone()
+    expected = get_state(clone)
+
+    play_random_moves(game, 10, random.Random(5))
+
+    assert get_state(clone) == expected
+    assert len(game.history) == 15
+
+
+def test_clone_should_continue_like_original(people):
+    game = create_game(people, seed=2)
+    play_random_moves(game, 5, random.Random(2))
+    clone = game.clone()
+
+    play_random_moves(clone, 100, random.Random(3))
+    play_random_moves(game, 100, random.Random(3))
+
+    assert game.stacks.reshuffles > 0
+    assert get_state(clone) == get_state(game)
+
+
 @pytest.fixture
 def people():
     return [Person(0, 'Piotr'), Person(1, 'Marta')]
@@ -1,4 +1,5 @@
 import pytest
+import json
 import random
 
 from rushing_turtles.game_controller import GameController, MAX_PLAYERS_IN_ROOM
@@ -411,11 +412,24 @@ def test_should_emit_full_game_state_on_ready_to_receive_game_state():
         players_names=['Piotr', 'Marta'],
         active_player_idx=0,
         player_cards=[
-            {"card_id": 28, "color": "YELLOW", "action": "PLUS"},
-            {"card_id": 12, "color": "RED", "action": "PLUS"},
-            {"card_id": 45, "color": "RAINBOW", "action": "MINUS"},
+            {"card_id": 31, "color": "YELLOW", "action": "MINUS"},
+            {"card_id": 3, "color": "BLUE", "action": "PLUS"},
             {"card_id": 41, "color": "RAINBOW", "action": "PLUS"},
-            {"card_id": 38, "color": "PURPLE", "action": "MINUS"}],
+            {"card_id": 43, "color": "RAINBOW", "action": "PLUS"},
+            {"card_id": 27, "color": "YELLOW", "action": "PLUS"}],
+        legal_moves=[
+            {"card_id": 3, "picked_color": None},
+            {"card_id": 41, "picked_color": "GREEN"},
+            {"card_id": 41, "picked_color": "BLUE"},
+            {"card_id": 41, "picked_color": "YELLOW"},
+            {"card_id": 41, "picked_color": "PURPLE"},
+            {"card_id": 41, "picked_color": "RED"},
+            {"card_id": 43, "picked_color": "GREEN"},
+            {"card_id": 43, "picked_color": "BLUE"},
+            {"card_id": 43, "picked_color": "YELLOW"},
+            {"card_id": 43, "picked_color": "PURPLE"},
+            {"card_id": 43, "picked_color": "RED"},
+            {"card_id": 27, "picked_color": None}],
         player_turtle_color='GREEN',
         recently_played_card=None
     )
@@ -454,23 +468,63 @@ def test_should_emit_player_cards_updated_to_player_who_played_the_card():
     controller.handle(WantToJoinMsg(1), 1)
     controller.handle(StartGameMsg(0), 0)
 
-    actual = controller.handle(PlayCardMsg(0, 28, None), 0)
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
 
     expected = MsgToSend(
         0,
         message='player cards updated',
         player_cards=[
-            {"card_id": 33, "color": "PURPLE", "action": "PLUS"},
-            {"card_id": 12, "color": "RED", "action": "PLUS"},
-            {"card_id": 45, "color": "RAINBOW", "action": "MINUS"},
+            {"card_id": 7, "color": "BLUE", "action": "MINUS"},
+            {"card_id": 31, "color": "YELLOW", "action": "MINUS"},
+            {"card_id": 3, "color": "BLUE", "action": "PLUS"},
             {"card_id": 41, "color": "RAINBOW", "action": "PLUS"},
-            {"card_id": 38, "color": "PURPLE", "action": "MINUS"}
+            {"card_id": 43, "color": "RAINBOW", "action": "PLUS"}
+        ],
+        legal_moves=[
+            {"card_id": 31, "picked_color": None},
+            {"card_id": 3, "picked_color": None},
+            {"card_id": 41, "picked_color": "GREEN"},
+            {"card_id": 41, "picked_color": "BLUE"},
+            {"card_id": 41, "picked_color": "YELLOW"},
+            {"card_id": 41, "picked_color": "PURPLE"},
+            {"card_id": 41, "picked_color": "RED"},
+            {"card_id": 43, "picked_color": "GREEN"},
+            {"card_id": 43, "picked_color": "BLUE"},
+            {"card_id": 43, "picked_color": "YELLOW"},
+            {"card_id": 43, "picked_color": "PURPLE"},
+            {"card_id": 43, "picked_color": "RED"}
         ]
     )
 
     assert expected in actual
 
 
+def test_should_emit_legal_moves_to_next_active_player():
+    controller = GameController()
+    start_game_for_two(controller)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    msg = [msg for msg in actual if msg.type == 'legal moves'][0]
+    content = json.loads(msg.content)
+    assert msg.websocket == 1
+    assert [card['card_id'] for card in content['player_cards']] == \
+        [39, 24, 44, 5, 26]
+    assert {move['card_id'] for move in content['legal_moves']} == \
+        {24, 44, 5, 26}
+
+
+def test_should_not_emit_legal_moves_to_disconnected_active_player():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.disconnected(1)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    assert not [msg for msg in actual if msg.type == 'legal moves']
+    assert all(msg.websocket is not None for msg in actual)
+
+
 def test_should_broadcast_game_state_update_after_player_moved():
     controller = GameController()
 
@@ -480,7 +534,7 @@ def test_should_broadcast_game_state_update_after_player_moved():
     controller.handle(WantToJoinMsg(1), 1)
     controller.handle(StartGameMsg(0), 0)
 
-    actual = controller.handle(PlayCardMsg(0, 28, None), 0)
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
 
     expected_msgs = [
         MsgToSend(
@@ -494,7 +548,7 @@ def test_should_broadcast_game_state_update_after_player_moved():
             },
             active_player_idx=1,
             recently_played_card={
-                "card_id": 28,
+                "card_id": 27,
                 "color": "YELLOW",
                 "action": "PLUS"
             }
@@ -510,7 +564,7 @@ def test_should_broadcast_game_state_update_after_player_moved():
             },
             active_player_idx=1,
             recently_played_card={
-                "card_id": 28,
+                "card_id": 27,
                 "color": "YELLOW",
                 "action": "PLUS"
             }
@@ -530,9 +584,9 @@ def test_should_broadcast_game_won_when_someone_wins():
     controller.handle(WantToJoinMsg(1), 1)
     controller.handle(StartGameMsg(0), 0)
 
-    controller.game.board.move(Turtle('YELLOW'), 8)
+    controller.get_room().game.board.move(Turtle('BLUE'), 8)
 
-    actual = controller.handle(PlayCardMsg(0, 28, None), 0)
+    actual = controller.handle(PlayCardMsg(0, 3, None), 0)
 
     expected_msgs = [
         MsgToSend(
@@ -540,14 +594,14 @@ def test_should_broadcast_game_won_when_someone_wins():
             message='game won',
             winner_name='Marta',
             sorted_list_of_player_places=['Marta', 'Piotr'],
-            sorted_list_of_players_turtle_colors=['YELLOW', 'GREEN']
+            sorted_list_of_players_turtle_colors=['BLUE', 'GREEN']
         ),
         MsgToSend(
             1,
             message='game won',
             winner_name='Marta',
             sorted_list_of_player_places=['Marta', 'Piotr'],
-            sorted_list_of_players_turtle_colors=['YELLOW', 'GREEN']
+            sorted_list_of_players_turtle_colors=['BLUE', 'GREEN']
         )
     ]
 
@@ -564,9 +618,9 @@ def test_should_emit_room_updated_when_player_plays_again_after_won():
     controller.handle(WantToJoinMsg(1), 1)
     controller.handle(StartGameMsg(0), 0)
 
-    controller.game.board.move(Turtle('YELLOW'), 8)
+    controller.get_room().game.board.move(Turtle('BLUE'), 8)
 
-    controller.handle(PlayCardMsg(0, 28, None), 0)
+    controller.handle(PlayCardMsg(0, 3, None), 0)
 
     actual = controller.handle(WantToJoinMsg(0), 0)
 
@@ -615,3 +669,428 @@ def test_clear_disconnected_should_clear_game_when_no_players_left_in_room():
         status='can create',
         list_of_players_in_room=[]
     )
+
+
+def test_should_emit_can_create_in_each_of_separate_rooms():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr', 'a'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+    actual = controller.handle(HelloServerMsg(1, 'Marta', 'b'), 1)
+
+    assert actual == MsgToSend(
+        1,
+        message='hello client',
+        status='can create',
+        list_of_players_in_room=[]
+    )
+
+
+def test_room_update_should_be_broadcast_only_within_the_room():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr', 'a'), 0)
+    controller.handle(HelloServerMsg(1, 'Marta', 'b'), 1)
+    actual = controller.handle(WantToJoinMsg(0), 0)
+
+    assert [msg.websocket for msg in actual] == [0]
+
+
+def test_should_run_independent_games_in_separate_rooms():
+    controller = GameController()
+
+    for pid, room_id in enumerate(['a', 'a', 'b', 'b']):
+        controller.handle(HelloServerMsg(pid, f'Player_{pid}', room_id), pid)
+        controller.handle(WantToJoinMsg(pid), pid)
+    controller.handle(StartGameMsg(0), 0)
+    controller.handle(StartGameMsg(2), 2)
+
+    assert controller.get_room('a').game is not controller.get_room('b').game
+    assert controller.get_room('b').game.get_person_idx(
+        controller.get_room('b').players[2]) == 0
+
+
+def test_hello_server_without_room_id_should_use_default_room():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+
+    assert controller.get_room().people[0].id == 0
+
+
+def test_get_room_should_raise_when_room_does_not_exist():
+    controller = GameController()
+
+    with pytest.raises(ValueError):
+        controller.get_room('a')
+
+
+def test_room_should_be_removed_when_last_person_disconnects():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr', 'a'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.disconnected(0)
+
+    with pytest.raises(ValueError):
+        controller.get_room('a')
+
+
+def test_should_resume_in_the_room_of_the_game_when_reconnecting():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr', 'a'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.handle(HelloServerMsg(1, 'Marta', 'a'), 1)
+    controller.handle(WantToJoinMsg(1), 1)
+    controller.handle(StartGameMsg(0), 0)
+    controller.disconnected(0)
+
+    actual = controller.handle(HelloServerMsg(0, 'Piotr'), 2)
+
+    assert actual.content == MsgToSend(
+        2,
+        message='hello client',
+        status='can resume',
+        list_of_players_in_room=['Piotr', 'Marta']
+    ).content
+
+
+def test_player_should_be_able_to_continue_the_game_after_reconnecting():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.handle(HelloServerMsg(1, 'Marta'), 1)
+    controller.handle(WantToJoinMsg(1), 1)
+    controller.handle(StartGameMsg(0), 0)
+    controller.disconnected(0)
+    controller.handle(HelloServerMsg(0, 'Piotr'), 2)
+
+    actual = controller.handle(ReadyToReceiveGameState(0), 2)
+
+    assert actual.websocket == 2
+    assert actual.type == 'full game state'
+
+
+def test_disconnected_person_should_not_be_found_by_old_websocket():
+    controller = GameController()
+
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.disconnected(0)
+
+    with pytest.raises(ValueError):
+        controller.get_room()._find_person_by_websocket(0)
+
+
+def test_game_state_should_be_reused_while_game_does_not_change():
+    controller = GameController()
+    room = start_game_for_two(controller)
+
+    first = room._get_game_state()
+    second = room._get_game_state()
+
+    assert first is second
+
+
+def test_game_state_should_be_rebuilt_after_board_changes():
+    controller = GameController()
+    room = start_game_for_two(controller)
+
+    first = room._get_game_state()
+    room.game.board.move(Turtle('YELLOW'), 1)
+    second = room._get_game_state()
+
+    assert first is not second
+    assert second['board']['turtles_in_game_positions'][0] == ['YELLOW']
+
+
+def start_game_for_two(controller):
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(HelloServerMsg(1, 'Marta'), 1)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.handle(WantToJoinMsg(1), 1)
+    controller.handle(StartGameMsg(0), 0)
+    return controller.get_room()
+
+
+def test_full_game_state_should_contain_version_in_delta_mode():
+    controller = GameController()
+    start_game_for_two(controller)
+
+    actual = controller.handle(ReadyToReceiveGameState(0, True), 0)
+
+    assert json.loads(actual.content)['version'] == 0
+
+
+def test_should_broadcast_game_state_delta_to_delta_subscribers():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.handle(ReadyToReceiveGameState(0, True), 0)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    expected = MsgToSend(
+        0,
+        message='game state delta',
+        base_version=0,
+        version=2,
+        board={
+            'turtles_in_game_positions': [[0, ['YELLOW']]],
+            'turtles_on_start_positions': []
+        },
+        number_of_start_stacks=4,
+        active_player_idx=1,
+        recently_played_card={
+            "card_id": 27,
+            "color": "YELLOW",
+            "action": "PLUS"
+        }
+    )
+    assert expected in actual
+
+
+def test_should_broadcast_full_game_state_to_players_without_delta_mode():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.handle(ReadyToReceiveGameState(0, True), 0)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    assert [msg.websocket for msg in actual
+            if msg.type == 'game state updated'] == [1]
+
+
+def test_should_emit_player_cards_delta_to_delta_subscriber():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.handle(ReadyToReceiveGameState(0, True), 0)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    expected = MsgToSend(
+        0,
+        message='player cards delta',
+        version=2,
+        removed_card_ids=[27],
+        added_cards=[{"card_id": 7, "color": "BLUE", "action": "MINUS"}],
+        legal_moves=[
+            {"card_id": 31, "picked_color": None},
+            {"card_id": 3, "picked_color": None},
+            {"card_id": 41, "picked_color": "GREEN"},
+            {"card_id": 41, "picked_color": "BLUE"},
+            {"card_id": 41, "picked_color": "YELLOW"},
+            {"card_id": 41, "picked_color": "PURPLE"},
+            {"card_id": 41, "picked_color": "RED"},
+            {"card_id": 43, "picked_color": "GREEN"},
+            {"card_id": 43, "picked_color": "BLUE"},
+            {"card_id": 43, "picked_color": "YELLOW"},
+            {"card_id": 43, "picked_color": "PURPLE"},
+            {"card_id": 43, "picked_color": "RED"}
+        ]
+    )
+    assert expected in actual
+
+
+def test_delta_should_start_from_previous_broadcast():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.handle(ReadyToReceiveGameState(1, True), 1)
+    controller.handle(PlayCardMsg(0, 27, None), 0)
+    card = next(card for card in controller.get_room().game.active_player.cards
+                if not card.is_rainbow() and card.offset > 0)
+
+    actual = controller.handle(PlayCardMsg(1, card.id, None), 1)
+
+    delta = [json.loads(msg.content) for msg in actual
+             if msg.type == 'game state delta'][0]
+    assert delta['base_version'] == 2
+    assert delta['version'] == 4
+
+
+def test_ready_to_receive_without_delta_should_disable_delta_mode():
+    controller = GameController()
+    start_game_for_two(controller)
+    controller.handle(ReadyToReceiveGameState(0, True), 0)
+    controller.handle(ReadyToReceiveGameState(0), 0)
+
+    actual = controller.handle(PlayCardMsg(0, 27, None), 0)
+
+    assert 'game state delta' not in [msg.type for msg in actual]
+
+
+def start_game_with_bot(controller):
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.handle(StartGameMsg(0, 1), 0)
+    return controller.get_room()
+
+
+def play_any_card(controller, person_id):
+    room = controller.get_room()
+    person = room.people[person_id]
+    action = room.game.get_legal_actions(person)[0]
+    return controller.handle(
+        PlayCardMsg(person_id, action.card.id, action.color),
+        person.websocket)
+
+
+def test_start_game_should_add_bot_players():
+    controller = GameController()
+
+    room = start_game_with_bot(controller)
+
+    assert [player.person.name for player in room.game.players] == \
+        ['Piotr', 'Bot 1']
+
+
+def test_start_game_should_raise_when_there_are_too_many_bots():
+    controller = GameController()
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+
+    with pytest.raises(ValueError):
+        controller.handle(StartGameMsg(0, MAX_PLAYERS_IN_ROOM), 0)
+
+
+def test_should_return_bot_turn_when_bot_is_active():
+    controller = GameController()
+    start_game_with_bot(controller)
+
+    assert controller.get_bot_turns() == []
+    play_any_card(controller, 0)
+
+    [(room_id, turn)] = controller.get_bot_turns()
+    assert turn.person_id == -1
+    assert controller.get_bot_search_state(room_id, turn).hand == \
+        controller.get_room().game.active_player.cards
+
+
+def test_play_bot_move_should_play_card_of_bot():
+    controller = GameController()
+    room = start_game_with_bot(controller)
+    play_any_card(controller, 0)
+    [(room_id, turn)] = controller.get_bot_turns()
+    action = room.game.get_legal_actions(room.people[-1])[0]
+
+    controller.play_bot_move(room_id, turn, action.card.id, action.color)
+
+    assert room.game.history[-1].person_id == -1
+    assert room.game.active_player.person.id == 0
+
+
+def test_play_bot_move_should_ignore_outdated_turn():
+    controller = GameController()
+    room = start_game_with_bot(controller)
+    play_any_card(controller, 0)
+    [(room_id, turn)] = controller.get_bot_turns()
+    action = room.game.get_legal_actions(room.people[-1])[0]
+    controller.play_bot_move(room_id, turn, action.card.id, action.color)
+
+    actual = controller.play_bot_move(room_id, turn, action.card.id,
+                                      action.color)
+
+    assert actual == []
+    assert len(room.game.history) == 2
+
+
+def test_clear_disconnected_should_seat_bot_instead_of_player():
+    controller = GameController(bot_takeover=True)
+    room = start_game_for_two(controller)
+    controller.disconnected(1)
+
+    controller.clear_disconnected()
+
+    assert len(room.game.players) == 2
+    assert room.bots == {1}
+
+
+def test_player_should_resume_seat_played_by_bot():
+    controller = GameController(bot_takeover=True)
+    room = start_game_for_two(controller)
+    controller.disconnected(1)
+    controller.clear_disconnected()
+
+    actual = controller.handle(HelloServerMsg(1, 'Marta'), 2)
+
+    assert json.loads(actual.content)['status'] == 'can resume'
+    assert room.bots == set()
+    assert room.people[1].websocket == 2
+
+
+def test_clear_disconnected_should_end_game_when_only_bots_are_left():
+    controller = GameController(bot_takeover=True)
+    start_game_with_bot(controller)
+    controller.disconnected(0)
+
+    controller.clear_disconnected()
+
+    assert controller.rooms == {}
+
+
+def test_should_forget_people_seated_as_bots_when_game_ends():
+    controller = GameController(bot_takeover=True)
+    start_game_for_two(controller)
+    controller.disconnected(1)
+    controller.clear_disconnected()
+    controller.disconnected(0)
+    controller.clear_disconnected()
+
+    actual = controller.handle(HelloServerMsg(1, 'Marta', 'other'), 2)
+
+    assert controller.rooms_by_person == {1: controller.get_room('other')}
+    assert json.loads(actual.content)['status'] == 'can create'
+
+
+def test_should_not_let_client_take_over_seat_of_bot():
+    controller = GameController()
+    room = start_game_with_bot(controller)
+
+    with pytest.raises(ValueError):
+        controller.handle(HelloServerMsg(-1, 'Bot 1'), 1)
+
+    assert room.people[-1].websocket != 1
+    assert room.bots == {-1}
+
+
+def test_should_track_only_rooms_waiting_for_bot_move():
+    controller = GameController()
+    start_game_with_bot(controller)
+    assert controller.rooms_awaiting_bot == set()
+
+    play_any_card(controller, 0)
+    assert controller.rooms_awaiting_bot == {'main'}
+
+    room = controller.get_room()
+    action = room.game.get_legal_actions(room.people[-1])[0]
+    [(room_id, turn)] = controller.get_bot_turns()
+    controller.play_bot_move(room_id, turn, action.card.id, action.color)
+    assert controller.rooms_awaiting_bot == set()
+
+
+def test_bot_should_not_take_id_of_person_in_room():
+    controller = GameController()
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(HelloServerMsg(-1, 'Marta'), 1)
+    controller.handle(WantToJoinMsg(0), 0)
+    controller.handle(WantToJoinMsg(-1), 1)
+
+    controller.handle(StartGameMsg(0, 1), 0)
+
+    room = controller.get_room()
+    assert [player.person.name for player in room.game.players] == \
+        ['Piotr', 'Marta', 'Bot 1']
+    assert room.people[-1].websocket == 1
+    assert room.bots == {-2}
+
+
+@pytest.mark.parametrize('bots', ['1', True, 1.0, None])
+def test_start_game_should_raise_when_number_of_bots_is_not_integer(bots):
+    controller = GameController()
+    controller.handle(HelloServerMsg(0, 'Piotr'), 0)
+    controller.handle(WantToJoinMsg(0), 0)
+
+    with pytest.raises(ValueError):
+        controller.handle(StartGameMsg(0, bots), 0)
+
+    assert controller.get_room().game is None
@@ -0,0 +1,74 @@
+import time
+import random
+
+from rushing_turtles.bots.mcts import MCTSBot, search, get_search_state
+from rushing_turtles.model.game import create_game
+from rushing_turtles.model.person import Person
+from rushing_turtles.simulation import RandomPolicy, play_game
+
+
+def create_people():
+    return [Person(0, 'Piotr'), Person(1, 'Marta'), Person(2, 'Olek')]
+
+
+def test_search_state_should_not_reveal_cards_of_other_players():
+    game = create_game(create_people(), seed=1)
+    person = game.active_player.person
+
+    state = get_search_state(game, person)
+
+    other_ids = {card.id for player in game.players[1:]
+                 for card in player.cards}
+    assert other_ids <= {card.id for card in state.unknown_cards}
+    assert state.hand == game.get_persons_cards(person)
+
+
+def test_search_should_return_legal_move():
+    game = create_game(create_people(), seed=1)
+    person = game.active_player.person
+
+    actual = search(get_search_state(game, person), seed=0,
+                    max_iterations=200)
+
+    assert actual in [(action.card.id, action.color)
+                      for action in game.get_legal_actions(person)]
+
+
+def test_search_should_stop_after_time_budget():
+    game = create_game(create_people(), seed=1)
+    state = get_search_state(game, game.active_player.person)
+    start = time.monotonic()
+
+    search(state, time_budget=0.1, seed=0)
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_search_should_pick_winning_move():
+    game = create_game(create_people(), seed=1)
+    player = game.active_player
+    turtle = player.turtle
+    for offset in [1, 2, 2, 2]:
+        game.board.move(turtle, offset)
+    finishing = next(card for card in game.cards
+                     if card.color_id == turtle.color_id and card.offset == 2)
+    player.cards = [finishing] + [card for card in game.cards
+                                  if card.color_id != turtle.color_id and
+                                  not card.is_rainbow() and
+                                  card.offset > 0][:4]
+
+    actual = search(get_search_state(game, player.person), seed=0,
+                    max_iterations=300)
+
+    assert actual == (finishing.id, None)
+
+
+def test_mcts_bot_should_beat_random_player():
+    rng = random.Random(0)
+    wins = sum(
+        play_game([MCTSBot(max_iterations=100), RandomPolicy()],
+                  rng).winner_seat == 0
+        for _ in range(5)
+    )
+
+    assert wins >= 4
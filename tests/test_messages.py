@@ -7,6 +7,7 @@ from rushing_turtles.messages import WantToJoinMsg
 from rushing_turtles.messages import StartGameMsg
 from rushing_turtles.messages import ReadyToReceiveGameState
 from rushing_turtles.messages import PlayCardMsg
+from rushing_turtles.messages import MsgToSend
 
 
 def test_deserialize_should_raise_when_no_message_field():
@@ -93,3 +94,34 @@ def test_deserialize_should_deserialize_play_card_msg():
     actual = deserializer.deserialize(msg_json)
 
     assert actual == PlayCardMsg(0, 10, 'RED')
+
+
+def test_deserialize_should_deserialize_hello_server_msg_with_room_id():
+    deserializer = MessageDeserializer()
+    msg_json = json.dumps({
+      'message': 'hello server',
+      'player_name': 'Piotr',
+      'player_id': 0,
+      'room_id': 'turtles'}
+      )
+
+    actual = deserializer.deserialize(msg_json)
+
+    assert actual == HelloServerMsg(0, 'Piotr', 'turtles')
+
+
+def test_broadcast_should_create_message_for_every_websocket():
+    actual = MsgToSend.broadcast([0, 1], message='room update',
+                                 list_of_players_in_room=['Piotr'])
+
+    assert actual == [
+        MsgToSend(0, message='room update', list_of_players_in_room=['Piotr']),
+        MsgToSend(1, message='room update', list_of_players_in_room=['Piotr'])
+    ]
+
+
+def test_broadcast_should_share_encoded_content_between_messages():
+    msgs = MsgToSend.broadcast(range(5), message='room update',
+                               list_of_players_in_room=['Piotr'])
+
+    assert all(msg.content is msgs[0].content for msg in msgs)
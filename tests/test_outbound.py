@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+
+from rushing_turtles.outbound import OutboundQueue
+from rushing_turtles.outbound import DROP_OLDEST, DISCONNECT, BLOCK
+from rushing_turtles.messages import MsgToSend
+
+
+class StalledWebsocket(object):
+
+    def __init__(self):
+        self.received = []
+        self.closed = False
+        self.unblocked = asyncio.Event()
+
+    async def send(self, content):
+        await self.unblocked.wait()
+        self.received.append(content)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_init_should_raise_when_policy_is_unknown():
+    async def scenario():
+        OutboundQueue(StalledWebsocket(), 1, 'unknown', 1)
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_init_should_raise_when_size_is_not_positive():
+    async def scenario():
+        OutboundQueue(StalledWebsocket(), 0, BLOCK, 1)
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_writer_should_send_queued_messages_in_order():
+    async def scenario():
+        ws = StalledWebsocket()
+        ws.unblocked.set()
+        queue = OutboundQueue(ws, 4, BLOCK, 1)
+        msgs = [MsgToSend(ws, message=f'msg {i}') for i in range(3)]
+        for msg in msgs:
+            await queue.put(msg)
+        await queue.flush()
+        queue.close()
+        return ws.received, [msg.content for msg in msgs]
+
+    received, expected = asyncio.run(scenario())
+
+    assert received == expected
+
+
+def test_drop_oldest_should_keep_newest_messages_when_queue_is_full():
+    async def scenario():
+        ws = StalledWebsocket()
+        queue = OutboundQueue(ws, 2, DROP_OLDEST, 1)
+        for i in range(5):
+            await queue.put(MsgToSend(ws, message=f'msg {i}'))
+            await asyncio.sleep(0)
+        depth, dropped = queue.get_depth(), queue.dropped
+        ws.unblocked.set()
+        await queue.flush()
+        queue.close()
+        return depth, dropped, ws.received
+
+    depth, dropped, received = asyncio.run(scenario())
+
+    assert depth == 2
+    assert dropped == 2
+    assert received == [MsgToSend(None, message=f'msg {i}').content
+                        for i in (0, 3, 4)]
+
+
+def test_disconnect_should_close_websocket_when_queue_overflows():
+    async def scenario():
+        ws = StalledWebsocket()
+        queue = OutboundQueue(ws, 1, DISCONNECT, 1)
+        for i in range(3):
+            await queue.put(MsgToSend(ws, message=f'msg {i}'))
+            await asyncio.sleep(0)
+        return ws.closed, queue.closed, queue.get_depth()
+
+    ws_closed, queue_closed, depth = asyncio.run(scenario())
+
+    assert ws_closed
+    assert queue_closed
+    assert depth == 0
+
+
+def test_block_should_wait_until_there_is_room_in_the_queue():
+    async def scenario():
+        ws = StalledWebsocket()
+        queue = OutboundQueue(ws, 1, BLOCK, 1)
+        await queue.put(MsgToSend(ws, message='first'))
+        await asyncio.sleep(0)
+        await queue.put(MsgToSend(ws, message='second'))
+        blocked = asyncio.ensure_future(
+            queue.put(MsgToSend(ws, message='third')))
+        await asyncio.sleep(0.01)
+        was_blocked = not blocked.done()
+        ws.unblocked.set()
+        await blocked
+        await queue.flush()
+        queue.close()
+        return was_blocked, queue.dropped, len(ws.received)
+
+    was_blocked, dropped, received_cnt = asyncio.run(scenario())
+
+    assert was_blocked
+    assert dropped == 0
+    assert received_cnt == 3
@@ -112,6 +112,17 @@ def test_player_shouldnt_have_card_after_its_removal(person, turtle):
     assert not player.has_card(card)
 
 
+def test_clone_should_keep_cards_when_original_plays(person, turtle):
+    card = Card(0, 'RED', 'PLUS')
+    player = Player(person, turtle, [card])
+    clone = player.clone()
+
+    player.remove_card(card)
+    player.add_card(Card(1, 'RED', 'MINUS'))
+
+    assert clone.cards == [card]
+
+
 @pytest.fixture
 def person():
     return Person(0, 'Piotr')
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from rushing_turtles.server import GameServer
+from rushing_turtles.game_controller import GameController
+from rushing_turtles.messages import MessageDeserializer, MsgToSend
+from rushing_turtles.messages import HelloServerMsg, WantToJoinMsg
+from rushing_turtles.messages import StartGameMsg, PlayCardMsg
+from rushing_turtles.outbound import DROP_OLDEST
+from rushing_turtles.bots.mcts import search
+
+
+class FakeWebsocket(object):
+
+    def __init__(self, name, delay=0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+
+    async def send(self, content):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f'{self.name} is broken')
+        self.received.append(content)
+
+    def __repr__(self):
+        return self.name
+
+
+class FakeConnection(FakeWebsocket):
+
+    def __init__(self, name, incoming, delay=0):
+        super().__init__(name, delay)
+        self.incoming = incoming
+
+    def __aiter__(self):
+        return self._read()
+
+    async def _read(self):
+        for message in self.incoming:
+            yield message
+
+    async def close(self):
+        pass
+
+
+def test_send_messages_should_deliver_message_to_every_recipient():
+    server = create_server()
+    websockets = [FakeWebsocket(f'ws{i}') for i in range(3)]
+
+    asyncio.run(server._send_messages(
+        [MsgToSend(ws, message='room update') for ws in websockets]))
+
+    assert all(len(ws.received) == 1 for ws in websockets)
+
+
+def test_send_messages_should_accept_single_message():
+    server = create_server()
+    ws = FakeWebsocket('ws')
+
+    asyncio.run(server._send_messages(MsgToSend(ws, message='room update')))
+
+    assert len(ws.received) == 1
+
+
+def test_send_messages_should_keep_order_of_messages_to_the_same_socket():
+    server = create_server()
+    ws = FakeWebsocket('ws')
+    msgs = [MsgToSend(ws, message=f'msg {i}') for i in range(5)]
+
+    asyncio.run(server._send_messages(msgs))
+
+    assert ws.received == [msg.content for msg in msgs]
+
+
+def test_slow_recipient_should_not_block_other_recipients():
+    server = create_server(send_timeout=0.05)
+    slow = FakeWebsocket('slow', delay=1)
+    fast = FakeWebsocket('fast')
+
+    asyncio.run(server._send_messages([
+        MsgToSend(slow, message='game state updated'),
+        MsgToSend(fast, message='game state updated')
+    ]))
+
+    assert not slow.received
+    assert len(fast.received) == 1
+
+
+def test_failing_recipient_should_not_prevent_delivery_to_others():
+    server = create_server()
+    broken = FakeWebsocket('broken', fail=True)
+    healthy = FakeWebsocket('healthy')
+
+    asyncio.run(server._send_messages([
+        MsgToSend(broken, message='room update'),
+        MsgToSend(healthy, message='room update')
+    ]))
+
+    assert len(healthy.received) == 1
+
+
+def test_sequential_mode_should_isolate_failures_as_well():
+    server = create_server(concurrent_send=False)
+    broken = FakeWebsocket('broken', fail=True)
+    healthy = FakeWebsocket('healthy')
+
+    asyncio.run(server._send_messages([
+        MsgToSend(broken, message='room update'),
+        MsgToSend(healthy, message='room update')
+    ]))
+
+    assert len(healthy.received) == 1
+
+
+def test_serve_should_not_wait_for_client_that_does_not_read():
+    server = create_server(outbound_queue_size=2,
+                           overflow_policy=DROP_OLDEST)
+    incoming = [json.dumps({'message': 'hello server', 'player_id': 0,
+                            'player_name': 'Piotr'})] * 10
+    ws = FakeConnection('stalled', incoming, delay=10)
+
+    async def scenario():
+        await asyncio.wait_for(server.serve(ws), 1)
+
+    asyncio.run(scenario())
+
+    assert server.get_outbound_metrics()['dropped_messages'] > 0
+
+
+def test_outbound_metrics_should_report_queue_depth_of_open_connections():
+    server = create_server(outbound_queue_size=5)
+    ws = FakeWebsocket('stalled', delay=10)
+
+    async def scenario():
+        server._open_outbound(ws)
+        await server._send_messages(
+            [MsgToSend(ws, message=f'msg {i}') for i in range(4)])
+        await asyncio.sleep(0)
+        metrics = server.get_outbound_metrics()
+        server._close_outbound(ws)
+        return metrics
+
+    metrics = asyncio.run(scenario())
+
+    assert metrics == {
+        'connections': 1,
+        'queued_messages': 3,
+        'max_queue_depth': 3,
+        'dropped_messages': 0
+    }
+
+
+def create_server(**kwargs):
+    return GameServer(GameController(), MessageDeserializer(), **kwargs)
+
+
+def test_bot_should_play_its_turn_in_executor():
+    controller = GameController()
+    server = GameServer(controller, MessageDeserializer(),
+                        bot_time_budget=0.05)
+    human = FakeWebsocket('human')
+    controller.handle(HelloServerMsg(0, 'Piotr'), human)
+    controller.handle(WantToJoinMsg(0), human)
+    controller.handle(StartGameMsg(0, 1), human)
+    game = controller.get_room().game
+    action = game.get_legal_actions(game.active_player.person)[0]
+    controller.handle(PlayCardMsg(0, action.card.id, action.color), human)
+
+    async def scenario():
+        server._schedule_bot_turns()
+        while game.active_player.person.id != 0:
+            await asyncio.sleep(0.01)
+
+    with ProcessPoolExecutor(1) as executor:
+        server.bot_executor = executor
+        asyncio.run(asyncio.wait_for(scenario(), 10))
+
+    assert [entry.person_id for entry in game.history] == [0, -1]
+
+
+def test_bot_turns_should_not_exceed_concurrency_limit(monkeypatch):
+    controller = GameController()
+    server = GameServer(controller, MessageDeserializer(),
+                        max_concurrent_bot_turns=2)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def counting_search(state, time_budget):
+        with lock:
+            running.append(state)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(state)
+        return search(state, 0)
+
+    monkeypatch.setattr('rushing_turtles.server.search', counting_search)
+    games = []
+    for idx in range(5):
+        human = FakeWebsocket(f'human {idx}')
+        controller.handle(HelloServerMsg(idx, 'Piotr', f'room {idx}'), human)
+        controller.handle(WantToJoinMsg(idx), human)
+        controller.handle(StartGameMsg(idx, 1), human)
+        game = controller.get_room(f'room {idx}').game
+        action = game.get_legal_actions(game.active_player.person)[0]
+        controller.handle(PlayCardMsg(idx, action.card.id, action.color),
+                          human)
+        games.append(game)
+
+    async def scenario():
+        server._schedule_bot_turns()
+        while any(game.active_player.person.id < 0 for game in games):
+            await asyncio.sleep(0.01)
+
+    with ThreadPoolExecutor(5) as executor:
+        server.bot_executor = executor
+        asyncio.run(asyncio.wait_for(scenario(), 10))
+
+    assert len(peak) == 5
+    assert max(peak) == 2
@@ -0,0 +1,50 @@
+import random
+
+from rushing_turtles.simulation import simulate, play_game
+from rushing_turtles.simulation import RandomPolicy, GreedyPolicy
+from rushing_turtles.simulation import SimulationStats, GameResult
+
+
+def test_play_game_should_finish_with_winner():
+    result = play_game([RandomPolicy(), GreedyPolicy()], random.Random(0))
+
+    assert result.winner_seat in [0, 1]
+    assert result.turns > 0
+
+
+def test_simulate_should_aggregate_all_games():
+    stats = simulate([RandomPolicy(), RandomPolicy(), RandomPolicy()], 30,
+                     processes=1, chunk_size=7)
+
+    assert stats.games == 30
+    assert sum(stats.wins_by_seat) + stats.unfinished == 30
+    assert sum(stats.turns.values()) == 30
+
+
+def test_simulate_should_be_reproducible_for_the_same_seed():
+    policies = [RandomPolicy(), GreedyPolicy()]
+
+    stats = simulate(policies, 20, seed=3, processes=1, chunk_size=5)
+    other = simulate(policies, 20, seed=3, processes=2, chunk_size=5)
+
+    assert stats.to_dict() == other.to_dict()
+
+
+def test_merge_should_sum_statistics():
+    stats = SimulationStats(2)
+    stats.add(GameResult(0, 10, 1))
+    other = SimulationStats(2)
+    other.add(GameResult(1, 20, 0))
+    other.add(GameResult(None, 30, 2))
+
+    stats.merge(other)
+
+    assert stats.to_dict() == {
+        'games': 3,
+        'unfinished': 1,
+        'win_rate_by_seat': [1 / 3, 1 / 3],
+        'mean_turns': 20.0,
+        'min_turns': 10,
+        'max_turns': 30,
+        'mean_reshuffles': 1.0
+    }
@@ -0,0 +1,108 @@
+import pytest
+
+from rushing_turtles.bots.transposition import TranspositionTable, make_key
+from rushing_turtles.bots.transposition import LRU, DEPTH_PREFERRED
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.card import Card
+from rushing_turtles.model.turtle import Turtle
+
+
+def test_init_should_raise_when_policy_is_unknown():
+    with pytest.raises(ValueError):
+        TranspositionTable(10, 'unknown')
+
+
+def test_init_should_raise_when_size_is_not_positive():
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+
+
+def test_get_should_return_stored_value():
+    table = TranspositionTable(10)
+
+    table.put((1, 0, ()), 0.5)
+
+    assert table.get((1, 0, ())) == 0.5
+
+
+def test_get_should_return_none_for_unknown_key():
+    table = TranspositionTable(10)
+
+    assert table.get((1, 0, ())) is None
+
+
+def test_get_should_miss_when_stored_entry_is_too_shallow():
+    table = TranspositionTable(10)
+
+    table.put((1, 0, ()), 0.5, depth=1)
+
+    assert table.get((1, 0, ()), min_depth=2) is None
+
+
+def test_lru_table_should_evict_least_recently_used_entry():
+    table = TranspositionTable(2, LRU)
+    table.put((1, 0, ()), 'a')
+    table.put((2, 0, ()), 'b')
+    table.get((1, 0, ()))
+
+    table.put((3, 0, ()), 'c')
+
+    assert table.get((2, 0, ())) is None
+    assert table.get((1, 0, ())) == 'a'
+    assert len(table) == 2
+
+
+def test_depth_preferred_table_should_keep_deeper_entry():
+    table = TranspositionTable(1, DEPTH_PREFERRED)
+    table.put((1, 0, ()), 'deep', depth=3)
+
+    table.put((2, 0, ()), 'shallow', depth=1)
+
+    assert table.get((1, 0, ())) == 'deep'
+    assert table.get((2, 0, ())) is None
+
+
+def test_depth_preferred_table_should_replace_shallower_entry():
+    table = TranspositionTable(1, DEPTH_PREFERRED)
+    table.put((1, 0, ()), 'shallow', depth=1)
+
+    table.put((2, 0, ()), 'deep', depth=3)
+
+    assert table.get((2, 0, ())) == 'deep'
+    assert table.get_stats()['evictions'] == 1
+
+
+def test_get_stats_should_count_hits_and_misses():
+    table = TranspositionTable(10)
+    table.put((1, 0, ()), 'a')
+
+    table.get((1, 0, ()))
+    table.get((1, 0, ()))
+    table.get((2, 0, ()))
+    table.get((3, 0, ()))
+
+    assert table.get_stats() == {
+        'size': 1,
+        'max_size': 10,
+        'hits': 2,
+        'misses': 2,
+        'hit_rate': 0.5,
+        'evictions': 0
+    }
+
+
+def test_make_key_should_not_depend_on_order_of_cards():
+    board = Board([Turtle('RED')])
+    cards = [Card(3, 'RED', 'PLUS'), Card(1, 'RED', 'MINUS')]
+
+    assert make_key(board, 0, cards) == make_key(board, 0, cards[::-1])
+
+
+def test_make_key_should_change_when_board_changes():
+    turtle = Turtle('RED')
+    board = Board([turtle])
+    key = make_key(board, 0, [])
+
+    board.move(turtle, 1)
+
+    assert make_key(board, 0, []) != key
@@ -6,3 +6,13 @@ from rushing_turtles.model.turtle import Turtle
 def test_should_raise_error_when_turtle_has_invalid_color():
     with pytest.raises(ValueError):
         Turtle('invalid color')
+
+
+def test_turtles_with_the_same_color_should_be_equal():
+    assert Turtle('RED') == Turtle('RED')
+    assert Turtle('RED') != Turtle('BLUE')
+    assert len({Turtle('RED'), Turtle('RED')}) == 1
+
+
+def test_color_should_be_translated_back_to_string():
+    assert Turtle('PURPLE').color == 'PURPLE'
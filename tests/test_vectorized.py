@@ -0,0 +1,59 @@
+import pytest
+import random
+import numpy as np
+
+from rushing_turtles.vectorized import BoardBatch, simulate_random_games
+from rushing_turtles.model.board import Board
+from rushing_turtles.model.turtle import Turtle, COLORS
+
+
+def test_board_batch_should_match_board_on_random_moves():
+    rng = random.Random(0)
+    size = 50
+    turtles = [Turtle(color) for color in COLORS]
+    boards = [Board(turtles) for _ in range(size)]
+    batch = BoardBatch(size)
+
+    for _ in range(60):
+        picked = np.array([rng.randrange(len(turtles)) for _ in range(size)])
+        offsets = np.array([rng.choice([1, 2, -1, -2]) for _ in range(size)])
+        active = np.array([not board.has_anyone_finished()
+                           for board in boards])
+        for idx, board in enumerate(boards):
+            turtle = turtles[picked[idx]]
+            if board._find_pos(turtle) == 0:
+                offsets[idx] = abs(offsets[idx])
+            if active[idx]:
+                board.move(turtle, int(offsets[idx]))
+
+        batch.move(picked, offsets, active)
+
+        for idx, board in enumerate(boards):
+            assert_boards_equal(batch, idx, board, turtles)
+
+
+def assert_boards_equal(batch, idx, board, turtles):
+    restored = batch.to_board(idx)
+    assert restored.start_field == board.start_field
+    assert restored.further_fields == board.further_fields
+    assert restored.positions == board.positions
+    assert batch.has_anyone_finished()[idx] == board.has_anyone_finished()
+    assert [turtles[turtle_idx] for turtle_idx in batch.get_ranking()[idx]] \
+        == board.get_ranking()
+    assert [bool(is_last) for is_last in batch.get_last_mask()[idx]] == \
+        [board.is_last(turtle) for turtle in turtles]
+
+
+def test_move_should_raise_when_moving_backward_from_start():
+    batch = BoardBatch(2)
+
+    with pytest.raises(ValueError):
+        batch.move(np.array([0, 0]), np.array([1, -1]))
+
+
+def test_simulate_random_games_should_finish_all_games():
+    winners, turns = simulate_random_games(200, 3,
+                                           np.random.default_rng(0))
+
+    assert set(winners) <= {0, 1, 2}
+    assert (turns > 0).all()